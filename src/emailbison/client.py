@@ -1,15 +1,22 @@
 from __future__ import annotations
 
 import json
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import Any, TypeVar
 
 import httpx
 
 from .config import Settings
 from .utils.redact import redact_token
 
+# Upper bound on concurrent requests issued over the shared connection pool.
+MAX_CONCURRENT_REQUESTS = 16
+
+_T = TypeVar("_T")
+
 
 class EmailBisonError(RuntimeError):
     pass
@@ -39,20 +46,55 @@ class DebugInfo:
 
 
 class EmailBisonClient:
-    def __init__(self, settings: Settings, *, debug: bool = False):
+    def __init__(
+        self,
+        settings: Settings,
+        *,
+        debug: bool = False,
+        http_client: httpx.Client | None = None,
+    ):
+        """Create a client for `settings`.
+
+        Pass `http_client` to share one connection pool between several clients;
+        it is left open by `close()` and its base URL/headers are not relied on.
+        """
         self.settings = settings
         self.debug = debug
-        self._client = httpx.Client(
+        self._timeout = httpx.Timeout(self.settings.timeout_seconds)
+        self._headers = {
+            "Authorization": f"Bearer {self.settings.api_token}",
+            "Accept": "application/json",
+        }
+        self._owns_client = http_client is None
+        self._client = http_client or httpx.Client(
             base_url=self.settings.base_url,
-            timeout=httpx.Timeout(self.settings.timeout_seconds),
-            headers={
-                "Authorization": f"Bearer {self.settings.api_token}",
-                "Accept": "application/json",
-            },
+            timeout=self._timeout,
+            headers=self._headers,
         )
 
     def close(self) -> None:
-        self._client.close()
+        if self._owns_client:
+            self._client.close()
+
+    def _send(
+        self,
+        method: str,
+        path: str,
+        *,
+        headers: dict[str, str] | None = None,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        if self._owns_client:
+            return self._client.request(method, path, headers=headers, **kwargs)
+        # A shared client carries none of our settings; apply them per request.
+        url = f"{self.settings.base_url}{path}" if path.startswith("/") else path
+        return self._client.request(
+            method,
+            url,
+            headers={**self._headers, **(headers or {})},
+            timeout=self._timeout,
+            **kwargs,
+        )
 
     def debug_redacted_headers(self) -> dict[str, str]:
         return {
@@ -75,13 +117,15 @@ class EmailBisonClient:
 
         try:
             if json_body is None:
-                resp = self._client.request(method, path, **request_kwargs)
+                resp = self._send(method, path, **request_kwargs)
             else:
                 headers = {"Content-Type": "application/json"}
-                resp = self._client.request(
+                # Bodies may arrive pre-encoded (e.g. pydantic's model_dump_json); send as-is.
+                content = json_body if isinstance(json_body, bytes) else json.dumps(json_body)
+                resp = self._send(
                     method,
                     path,
-                    content=json.dumps(json_body),
+                    content=content,
                     headers=headers,
                     **request_kwargs,
                 )
@@ -161,7 +205,7 @@ class EmailBisonClient:
     def create_sequence_steps_v11(
         self,
         campaign_id: int,
-        payload: dict[str, Any],
+        payload: dict[str, Any] | bytes,
     ) -> tuple[dict[str, Any], DebugInfo]:
         path = f"{self.settings.campaigns_v11_path}/{campaign_id}/sequence-steps"
         return self.request_json("POST", path, json_body=payload)
@@ -169,7 +213,7 @@ class EmailBisonClient:
     def update_sequence_steps_v11(
         self,
         sequence_id: int,
-        payload: dict[str, Any],
+        payload: dict[str, Any] | bytes,
     ) -> tuple[dict[str, Any], DebugInfo]:
         path = f"{self.settings.campaigns_v11_path}/sequence-steps/{sequence_id}"
         return self.request_json("PUT", path, json_body=payload)
@@ -275,6 +319,30 @@ class EmailBisonClient:
             json_body={"start_date": start_date, "end_date": end_date},
         )
 
+    def campaign_stats_bulk(
+        self,
+        campaign_ids: list[int],
+        *,
+        start_date: str,
+        end_date: str,
+    ) -> dict[int, dict[str, Any] | EmailBisonError]:
+        """Fetch stats for many campaigns, keyed by campaign id.
+
+        EmailBison has no bulk stats endpoint, so the per-campaign requests run
+        concurrently. Failures are returned in place of the payload rather than raised,
+        so one bad campaign does not abort the rest.
+        """
+
+        def fetch(campaign_id: int) -> dict[str, Any] | EmailBisonError:
+            try:
+                raw, _ = self.campaign_stats(campaign_id, start_date=start_date, end_date=end_date)
+            except EmailBisonError as e:
+                return e
+            return raw
+
+        ids = list(dict.fromkeys(campaign_ids))
+        return dict(zip(ids, self._map_ids(fetch, ids), strict=True))
+
     def campaign_replies(
         self,
         campaign_id: int,
@@ -362,6 +430,53 @@ class EmailBisonClient:
         path = f"{self.settings.campaigns_path}/{campaign_id}/archive"
         return self.request_json("PATCH", path)
 
+    def pause_campaigns(
+        self,
+        campaign_ids: list[int],
+    ) -> dict[int, dict[str, Any] | EmailBisonError]:
+        return self._lifecycle_bulk(self.pause_campaign, campaign_ids)
+
+    def resume_campaigns(
+        self,
+        campaign_ids: list[int],
+    ) -> dict[int, dict[str, Any] | EmailBisonError]:
+        return self._lifecycle_bulk(self.resume_campaign, campaign_ids)
+
+    def archive_campaigns(
+        self,
+        campaign_ids: list[int],
+    ) -> dict[int, dict[str, Any] | EmailBisonError]:
+        return self._lifecycle_bulk(self.archive_campaign, campaign_ids)
+
+    def _lifecycle_bulk(
+        self,
+        fn: Callable[[int], tuple[dict[str, Any], DebugInfo]],
+        campaign_ids: list[int],
+    ) -> dict[int, dict[str, Any] | EmailBisonError]:
+        """Apply a lifecycle change to many campaigns, keyed by campaign id.
+
+        Like `campaign_stats_bulk`, failures are returned in place of the payload: the
+        other requests still complete, so the caller must see which ones succeeded.
+        """
+
+        def apply(campaign_id: int) -> dict[str, Any] | EmailBisonError:
+            try:
+                raw, _ = fn(campaign_id)
+            except EmailBisonError as e:
+                return e
+            return raw
+
+        ids = list(dict.fromkeys(campaign_ids))
+        return dict(zip(ids, self._map_ids(apply, ids), strict=True))
+
+    def _map_ids(self, fn: Callable[[int], _T], ids: list[int]) -> list[_T]:
+        # EmailBison has no bulk lifecycle endpoints; overlap the per-id requests on
+        # the pooled keep-alive connections instead of paying one RTT after another.
+        if len(ids) <= 1:
+            return [fn(i) for i in ids]
+        with ThreadPoolExecutor(max_workers=min(MAX_CONCURRENT_REQUESTS, len(ids))) as ex:
+            return list(ex.map(fn, ids))
+
     def upload_leads_csv(
         self,
         *,
@@ -383,7 +498,7 @@ class EmailBisonClient:
         try:
             with csv_path.open("rb") as fh:
                 files = {"csv": (csv_path.name, fh, "text/csv")}
-                resp = self._client.request(
+                resp = self._send(
                     "POST",
                     "/api/leads/bulk/csv",
                     headers=headers,
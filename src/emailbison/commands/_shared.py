@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import functools
+import sys
+from collections.abc import Callable, Iterable
+from typing import Any
+
+import typer
+
+from ..client import ApiError, AuthError, EmailBisonClient, NetworkError
+from ..config import ConfigError, load_settings
+from ..utils import jsonio
+
+_EXIT_USAGE = 2
+_EXIT_AUTH = 3
+_EXIT_API = 3
+_EXIT_NETWORK = 4
+
+# Reused by every command that accepts --base-url; Typer only reads these definitions.
+BASE_URL_OPTION = typer.Option(None, "--base-url")
+
+
+def _ctx_flags(ctx: typer.Context) -> tuple[bool, bool]:
+    """Return the global `(--json, --debug)` flags set by the root callback."""
+    obj = ctx.obj or {}
+    return bool(obj.get("json")), bool(obj.get("debug"))
+
+
+def _client_from_env(
+    ctx: typer.Context,
+    *,
+    base_url: str | None,
+    debug: bool,
+) -> EmailBisonClient:
+    """Return the client for this invocation, building it on first use.
+
+    Clients are cached on the shared `ctx.obj` and closed when the root context
+    exits, so every command in one process reuses the same connection pool.
+    """
+    clients: dict[str | None, EmailBisonClient] | None = None
+    if isinstance(ctx.obj, dict):
+        clients = ctx.obj.setdefault("clients", {})
+        client = clients.get(base_url)
+        if client is not None:
+            return client
+
+    try:
+        settings = load_settings(base_url=base_url)
+    except ConfigError as e:
+        typer.echo(str(e), err=True)
+        raise typer.Exit(code=_EXIT_AUTH) from e
+
+    client = EmailBisonClient(settings, debug=debug)
+    if clients is not None:
+        clients[base_url] = client
+    ctx.find_root().call_on_close(client.close)
+    return client
+
+
+class _Row(dict):
+    """Mapping for `str.format_map` that renders absent keys as None (like `dict.get`)."""
+
+    def __missing__(self, key: str) -> None:
+        return None
+
+
+def _dict_rows(data: Any) -> list[dict[str, Any]]:
+    if not isinstance(data, list):
+        return []
+    # Decoded JSON objects are always plain dicts, so an exact type check suffices.
+    return [row for row in data if type(row) is dict]
+
+
+def _format_rows(fmt: str, data: Any) -> list[str]:
+    return [fmt.format_map(_Row(row)) for row in _dict_rows(data)]
+
+
+def _dump_or_human(
+    *,
+    payload: dict[str, Any],
+    json_output: bool,
+    human_lines: Iterable[str] | None = None,
+) -> None:
+    """Write `payload` as JSON, or the human-readable lines, falling back to the raw payload.
+
+    A list of lines goes out in one joined echo. Any other iterable (e.g. a lazy generator)
+    is echoed line by line, so it is never materialized; it is not consumed for --json.
+    """
+    if json_output:
+        jsonio.dump(payload, sys.stdout)
+        return
+
+    if isinstance(human_lines, list):
+        if human_lines:
+            typer.echo("\n".join(human_lines))
+            return
+    elif human_lines is not None:
+        wrote = False
+        for line in human_lines:
+            typer.echo(line)
+            wrote = True
+        if wrote:
+            return
+
+    typer.echo(payload)
+
+
+def _echo_api_error(e: ApiError, *, prefix: str = "") -> None:
+    # Write the message and the (possibly large) details payload separately rather
+    # than concatenating them into one intermediate string.
+    typer.echo(f"{prefix}{e} Details: ", err=True, nl=False)
+    typer.echo(jsonio.dumps(e.details), err=True)
+
+
+def _with_api_error_handling(fn: Callable[..., None]) -> Callable[..., None]:
+    """Map client errors raised by a command to a message on stderr and an exit code."""
+
+    @functools.wraps(fn)
+    def wrapper(*args: Any, **kwargs: Any) -> None:
+        try:
+            return fn(*args, **kwargs)
+        except AuthError as e:
+            typer.echo(str(e), err=True)
+            raise typer.Exit(code=_EXIT_AUTH) from e
+        except NetworkError as e:
+            typer.echo(str(e), err=True)
+            raise typer.Exit(code=_EXIT_NETWORK) from e
+        except ApiError as e:
+            _echo_api_error(e)
+            raise typer.Exit(code=_EXIT_API) from e
+
+    return wrapper
@@ -2,24 +2,21 @@ from __future__ import annotations
 
 import csv
 import json
+import sys
 import time
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import typer
 
 from ..client import ApiError, AuthError, EmailBisonClient, NetworkError
-from ..config import ConfigError, load_settings
-from ..models import (
-    CampaignCreateSpec,
-    CampaignSchedule,
-    CampaignSettings,
-    CreateCampaignResult,
-    LeadsSpec,
-    SequenceSpec,
-    WorkflowStepResult,
-)
+from ..utils import jsonio
+
+if TYPE_CHECKING:
+    from ..models import CampaignCreateSpec
+
+from ._shared import BASE_URL_OPTION, _client_from_env, _ctx_flags, _echo_api_error
 
 # Additional campaign lifecycle + management commands
 from .campaign_admin import (
@@ -75,6 +72,10 @@ LEAD_LIST_FAILED_STATUSES = {"failed", "error"}
 LEAD_LIST_POLL_INTERVAL_SECONDS = 2.0
 LEAD_LIST_POLL_TIMEOUT_SECONDS = 300.0
 
+# Clock seams for the lead-list poll; tests swap these rather than the global `time` module.
+_sleep = time.sleep
+_monotonic = time.monotonic
+
 
 @dataclass(frozen=True)
 class BatchFilePlan:
@@ -105,14 +106,6 @@ app.command("stop-future-emails")(_stop_future_emails)
 app.add_typer(campaign_sequence_app, name="sequence")
 
 
-def _load_settings_or_exit(*, base_url: str | None) -> Any:
-    try:
-        return load_settings(base_url=base_url)
-    except ConfigError as e:
-        typer.echo(str(e), err=True)
-        raise typer.Exit(code=3) from e
-
-
 @app.command("create")
 def create_campaign(
     ctx: typer.Context,
@@ -191,12 +184,23 @@ def create_campaign(
         help="Skip preflight checks when starting.",
     ),
     # Config overrides
-    base_url: str | None = typer.Option(None, "--base-url"),
+    base_url: str | None = BASE_URL_OPTION,
 ) -> None:
-    json_output = bool(ctx.obj.get("json")) if ctx.obj else False
-    debug = bool(ctx.obj.get("debug")) if ctx.obj else False
+    # pydantic models are imported lazily: they dominate CLI startup time and only the
+    # create commands need them.
+    from ..models import (
+        CampaignCreateSpec,
+        CampaignSchedule,
+        CampaignSettings,
+        CreateCampaignResult,
+        LeadsSpec,
+        SequenceSpec,
+        WorkflowStepResult,
+    )
+
+    json_output, debug = _ctx_flags(ctx)
 
-    settings = _load_settings_or_exit(base_url=base_url)
+    client = _client_from_env(ctx, base_url=base_url, debug=debug)
 
     if file is not None:
         spec = _validate_spec(_load_json_file(file))
@@ -271,7 +275,6 @@ def create_campaign(
     sequence_id: int | None = None
     sequence_step_ids: list[int] | None = None
 
-    client = EmailBisonClient(settings, debug=debug)
     try:
         created_raw, dbg_create = client.create_campaign(name=spec.name, type=spec.type)
         campaign_id = _extract_id(created_raw)
@@ -317,10 +320,9 @@ def create_campaign(
 
         if spec.sequence is not None:
             # API expects: {title, sequence_steps: [...]} (exclude None in each step)
-            seq_steps = [s.model_dump(exclude_none=True) for s in spec.sequence.sequence_steps]
             seq_raw, dbg = client.create_sequence_steps_v11(
                 campaign_id,
-                {"title": spec.sequence.title, "sequence_steps": seq_steps},
+                spec.sequence.model_dump_json(exclude_none=True).encode(),
             )
             steps.append(
                 WorkflowStepResult(
@@ -536,7 +538,7 @@ def create_campaign(
     except WorkflowValidationError as e:
         if json_output:
             typer.echo(
-                json.dumps(
+                jsonio.dumps(
                     {
                         "error": {
                             "type": type(e).__name__,
@@ -545,7 +547,6 @@ def create_campaign(
                         "campaign_id": campaign_id,
                         "steps": [s.model_dump() for s in steps],
                     },
-                    indent=2,
                 )
             )
         else:
@@ -554,13 +555,12 @@ def create_campaign(
     except AuthError as e:
         if json_output:
             typer.echo(
-                json.dumps(
+                jsonio.dumps(
                     {
                         "error": {"type": type(e).__name__, "message": str(e)},
                         "campaign_id": campaign_id,
                         "steps": [s.model_dump() for s in steps],
                     },
-                    indent=2,
                 )
             )
         else:
@@ -569,13 +569,12 @@ def create_campaign(
     except NetworkError as e:
         if json_output:
             typer.echo(
-                json.dumps(
+                jsonio.dumps(
                     {
                         "error": {"type": type(e).__name__, "message": str(e)},
                         "campaign_id": campaign_id,
                         "steps": [s.model_dump() for s in steps],
                     },
-                    indent=2,
                 )
             )
         else:
@@ -584,7 +583,7 @@ def create_campaign(
     except ApiError as e:
         if json_output:
             typer.echo(
-                json.dumps(
+                jsonio.dumps(
                     {
                         "error": {
                             "type": type(e).__name__,
@@ -595,31 +594,27 @@ def create_campaign(
                         "campaign_id": campaign_id,
                         "steps": [s.model_dump() for s in steps],
                     },
-                    indent=2,
                 )
             )
         else:
-            typer.echo(f"{e} Details: {json.dumps(e.details, indent=2)}", err=True)
+            _echo_api_error(e)
         raise typer.Exit(code=3) from e
     except typer.Exit:
         raise
     except Exception as e:
         if json_output:
             typer.echo(
-                json.dumps(
+                jsonio.dumps(
                     {
                         "error": {"type": type(e).__name__, "message": str(e)},
                         "campaign_id": campaign_id,
                         "steps": [s.model_dump() for s in steps],
                     },
-                    indent=2,
                 )
             )
         else:
             typer.echo(f"Unexpected error: {e}", err=True)
         raise typer.Exit(code=5) from e
-    finally:
-        client.close()
 
     if json_output:
         typer.echo(result.model_dump_json(indent=2))
@@ -670,10 +665,11 @@ def create_batch_campaigns(
         help="JSON file containing campaign schedule payload.",
     ),
     dry_run: bool = typer.Option(False, "--dry-run", help="Preview without API calls."),
-    base_url: str | None = typer.Option(None, "--base-url"),
+    base_url: str | None = BASE_URL_OPTION,
 ) -> None:
-    json_output = bool(ctx.obj.get("json")) if ctx.obj else False
-    debug = bool(ctx.obj.get("debug")) if ctx.obj else False
+    from ..models import CampaignSchedule, CampaignSettings, SequenceSpec
+
+    json_output, debug = _ctx_flags(ctx)
 
     if not dir.exists() or not dir.is_dir():
         typer.echo(f"Directory not found: {dir}", err=True)
@@ -726,20 +722,33 @@ def create_batch_campaigns(
             ],
         }
         if json_output:
-            typer.echo(json.dumps(payload, indent=2))
+            jsonio.dump(payload, sys.stdout)
         else:
-            for p in plans:
-                typer.echo(
-                    f"[DRY-RUN] csv={p.path.name} campaign={p.campaign_name} leads={p.lead_count}"
-                )
-            typer.echo(
+            lines = [
+                f"[DRY-RUN] csv={p.path.name} campaign={p.campaign_name} leads={p.lead_count}"
+                for p in plans
+            ]
+            lines.append(
                 "summary: total_processed={total_processed} succeeded={succeeded} "
                 "failed={failed} leads_loaded={leads_loaded}".format(**payload["summary"])
             )
+            typer.echo("\n".join(lines))
         return
 
-    settings = _load_settings_or_exit(base_url=base_url)
-    client = EmailBisonClient(settings, debug=debug)
+    client = _client_from_env(ctx, base_url=base_url, debug=debug)
+
+    # Every campaign in the batch gets the same settings/schedule/sequence; dump them once.
+    settings_payload = (
+        settings_obj.model_dump(exclude_none=True) if settings_obj is not None else None
+    )
+    schedule_payload = (
+        schedule_obj.model_dump(exclude_none=True) if schedule_obj is not None else None
+    )
+    sequence_payload = (
+        sequence_obj.model_dump_json(exclude_none=True).encode()
+        if sequence_obj is not None
+        else None
+    )
 
     total_processed = 0
     succeeded = 0
@@ -747,89 +756,74 @@ def create_batch_campaigns(
     leads_loaded = 0
     file_results: list[dict[str, Any]] = []
 
-    try:
-        for plan in plans:
-            total_processed += 1
-            try:
-                upload_raw, _ = client.upload_leads_csv(
-                    name=plan.campaign_name,
-                    csv_path=plan.path,
-                    columns_to_map=plan.columns_to_map,
-                )
-                lead_list_id, initial_status = _extract_lead_list_info(upload_raw)
-                lead_list_status = _wait_for_lead_list_processing(
-                    client=client,
-                    lead_list_id=lead_list_id,
-                    initial_status=initial_status,
-                )
-
-                created_raw, _ = client.create_campaign(name=plan.campaign_name, type="outbound")
-                campaign_id = _extract_id(created_raw)
-
-                if settings_obj is not None:
-                    client.update_campaign_settings(
-                        campaign_id,
-                        settings_obj.model_dump(exclude_none=True),
-                    )
-                if schedule_obj is not None:
-                    client.create_campaign_schedule(
-                        campaign_id,
-                        schedule_obj.model_dump(exclude_none=True),
-                    )
-                if sequence_obj is not None:
-                    seq_steps = [
-                        s.model_dump(exclude_none=True) for s in sequence_obj.sequence_steps
-                    ]
-                    client.create_sequence_steps_v11(
-                        campaign_id,
-                        {"title": sequence_obj.title, "sequence_steps": seq_steps},
-                    )
-                if sender_email_id:
-                    client.attach_sender_emails(
-                        campaign_id,
-                        sender_email_ids=sender_email_id,
-                    )
+    for plan in plans:
+        total_processed += 1
+        try:
+            upload_raw, _ = client.upload_leads_csv(
+                name=plan.campaign_name,
+                csv_path=plan.path,
+                columns_to_map=plan.columns_to_map,
+            )
+            lead_list_id, initial_status = _extract_lead_list_info(upload_raw)
+            lead_list_status = _wait_for_lead_list_processing(
+                client=client,
+                lead_list_id=lead_list_id,
+                initial_status=initial_status,
+            )
 
-                client.attach_lead_list(
+            created_raw, _ = client.create_campaign(name=plan.campaign_name, type="outbound")
+            campaign_id = _extract_id(created_raw)
+
+            if settings_payload is not None:
+                client.update_campaign_settings(campaign_id, settings_payload)
+            if schedule_payload is not None:
+                client.create_campaign_schedule(campaign_id, schedule_payload)
+            if sequence_payload is not None:
+                client.create_sequence_steps_v11(campaign_id, sequence_payload)
+            if sender_email_id:
+                client.attach_sender_emails(
                     campaign_id,
-                    {"lead_list_id": lead_list_id, "allow_parallel_sending": False},
+                    sender_email_ids=sender_email_id,
                 )
 
-                succeeded += 1
-                leads_loaded += plan.lead_count
-                file_results.append(
-                    {
-                        "csv": str(plan.path),
-                        "campaign_name": plan.campaign_name,
-                        "campaign_id": campaign_id,
-                        "lead_list_id": lead_list_id,
-                        "lead_list_status": lead_list_status,
-                        "lead_count": plan.lead_count,
-                        "ok": True,
-                    }
-                )
-                if not json_output:
-                    typer.echo(
-                        f"ok csv={plan.path.name} campaign_id={campaign_id} "
-                        f"lead_list_id={lead_list_id} leads={plan.lead_count}"
-                    )
-            except (ApiError, AuthError, NetworkError, ValueError, WorkflowValidationError) as e:
-                failed += 1
-                file_results.append(
-                    {
-                        "csv": str(plan.path),
-                        "campaign_name": plan.campaign_name,
-                        "lead_count": plan.lead_count,
-                        "ok": False,
-                        "error_type": type(e).__name__,
-                        "error": str(e),
-                    }
+            client.attach_lead_list(
+                campaign_id,
+                {"lead_list_id": lead_list_id, "allow_parallel_sending": False},
+            )
+
+            succeeded += 1
+            leads_loaded += plan.lead_count
+            file_results.append(
+                {
+                    "csv": str(plan.path),
+                    "campaign_name": plan.campaign_name,
+                    "campaign_id": campaign_id,
+                    "lead_list_id": lead_list_id,
+                    "lead_list_status": lead_list_status,
+                    "lead_count": plan.lead_count,
+                    "ok": True,
+                }
+            )
+            if not json_output:
+                typer.echo(
+                    f"ok csv={plan.path.name} campaign_id={campaign_id} "
+                    f"lead_list_id={lead_list_id} leads={plan.lead_count}"
                 )
-                if not json_output:
-                    typer.echo(f"error csv={plan.path.name}: {e}", err=True)
-                continue
-    finally:
-        client.close()
+        except (ApiError, AuthError, NetworkError, ValueError, WorkflowValidationError) as e:
+            failed += 1
+            file_results.append(
+                {
+                    "csv": str(plan.path),
+                    "campaign_name": plan.campaign_name,
+                    "lead_count": plan.lead_count,
+                    "ok": False,
+                    "error_type": type(e).__name__,
+                    "error": str(e),
+                }
+            )
+            if not json_output:
+                typer.echo(f"error csv={plan.path.name}: {e}", err=True)
+            continue
 
     summary = {
         "total_processed": total_processed,
@@ -840,7 +834,7 @@ def create_batch_campaigns(
     payload = {"summary": summary, "files": file_results}
 
     if json_output:
-        typer.echo(json.dumps(payload, indent=2))
+        jsonio.dump(payload, sys.stdout)
     else:
         typer.echo(
             "summary: total_processed={total_processed} succeeded={succeeded} "
@@ -849,11 +843,11 @@ def create_batch_campaigns(
 
 
 def _load_json_file(path: Path) -> dict[str, Any]:
-    if not path.exists():
-        typer.echo(f"File not found: {path}", err=True)
-        raise typer.Exit(code=2)
     try:
-        data = json.loads(path.read_text(encoding="utf-8"))
+        data = jsonio.loads(path.read_bytes())
+    except FileNotFoundError as e:
+        typer.echo(f"File not found: {path}", err=True)
+        raise typer.Exit(code=2) from e
     except json.JSONDecodeError as e:
         typer.echo(f"Invalid JSON in {path}: {e}", err=True)
         raise typer.Exit(code=2) from e
@@ -864,6 +858,8 @@ def _load_json_file(path: Path) -> dict[str, Any]:
 
 
 def _validate_spec(data: dict[str, Any]) -> CampaignCreateSpec:
+    from ..models import CampaignCreateSpec
+
     try:
         return CampaignCreateSpec.model_validate(data)
     except Exception as e:
@@ -1043,19 +1039,19 @@ def _wait_for_lead_list_processing(
     if status and status.strip().lower() not in LEAD_LIST_PENDING_STATUSES:
         return status
 
-    start = time.monotonic()
-    while (time.monotonic() - start) <= LEAD_LIST_POLL_TIMEOUT_SECONDS:
+    start = _monotonic()
+    while (_monotonic() - start) <= LEAD_LIST_POLL_TIMEOUT_SECONDS:
         raw, _ = client.get_lead_list(lead_list_id)
         status = _extract_lead_list_status(raw)
         if status is None:
-            time.sleep(LEAD_LIST_POLL_INTERVAL_SECONDS)
+            _sleep(LEAD_LIST_POLL_INTERVAL_SECONDS)
             continue
         normalized = status.strip().lower()
         if normalized in LEAD_LIST_FAILED_STATUSES:
             raise WorkflowValidationError(f"Lead list {lead_list_id} processing failed: {status}")
         if normalized not in LEAD_LIST_PENDING_STATUSES:
             return status
-        time.sleep(LEAD_LIST_POLL_INTERVAL_SECONDS)
+        _sleep(LEAD_LIST_POLL_INTERVAL_SECONDS)
 
     raise WorkflowValidationError(
         f"Timed out waiting for lead list {lead_list_id} to finish processing."
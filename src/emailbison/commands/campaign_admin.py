@@ -1,57 +1,119 @@
 from __future__ import annotations
 
-import json
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 import typer
 
-from ..client import ApiError, AuthError, EmailBisonClient, NetworkError
-from ..config import ConfigError, load_settings
+from ..client import ApiError, EmailBisonError, NetworkError
+from ..utils import jsonio
+from ._shared import (
+    _EXIT_API,
+    _EXIT_NETWORK,
+    _EXIT_USAGE,
+    BASE_URL_OPTION,
+    _client_from_env,
+    _ctx_flags,
+    _dump_or_human,
+    _echo_api_error,
+    _format_rows,
+    _with_api_error_handling,
+)
 
 app = typer.Typer(add_completion=False)
 
+_STAT_METRICS = ("sent", "delivered", "opened", "clicked", "replied", "bounced")
+# Stats payload field -> (summary metric, rank); the `emails_*` spelling wins over the alias.
+_STAT_FIELDS = {
+    **{f"emails_{metric}": (metric, 0) for metric in _STAT_METRICS},
+    **{metric: (metric, 1) for metric in _STAT_METRICS},
+}
+
+_LIST_FMT = "id={id} status={status} name={name}"
+_SENDER_FMT = "id={id} status={status} email={email}"
+_REPLY_FMT = "id={id} from={from_email_address} subject={subject}"
+
+
+def _unique_ids(values: list[int] | None) -> list[int] | None:
+    # Repeated flags (`--tag-id 5 --tag-id 5`) should not reach the API twice.
+    return sorted(set(values)) if values else None
+
 
 def _require_non_empty_int_list(values: list[int] | None, *, what: str) -> list[int]:
-    vals = values or []
+    vals = _unique_ids(values)
     if not vals:
         typer.echo(f"Missing at least one {what} (repeatable).", err=True)
-        raise typer.Exit(code=2)
+        raise typer.Exit(code=_EXIT_USAGE)
     return vals
 
 
-def _client_from_env(*, base_url: str | None, debug: bool) -> EmailBisonClient:
-    try:
-        settings = load_settings(base_url=base_url)
-    except ConfigError as e:
-        typer.echo(str(e), err=True)
-        raise typer.Exit(code=3) from e
-    return EmailBisonClient(settings, debug=debug)
+def _dump_ndjson(payload: dict[str, Any]) -> None:
+    """Write each row of a list response as one compact JSON document per line.
+
+    A response without a `data` list is written whole, as a single line, rather than dropped.
+    """
+    data = payload.get("data")
+    if not isinstance(data, list):
+        typer.echo(jsonio.dumps(payload, indent=False))
+        return
+    if data:
+        typer.echo(jsonio.dumps_lines(data))
 
 
-def _dump_or_human(
+def _dump_lifecycle(
     *,
-    payload: dict[str, Any],
+    results: dict[int, dict[str, Any] | EmailBisonError],
     json_output: bool,
-    human_lines: list[str] | None = None,
 ) -> None:
-    if json_output:
-        typer.echo(json.dumps(payload, indent=2))
+    if len(results) == 1:
+        (outcome,) = results.values()
+        if isinstance(outcome, EmailBisonError):
+            raise outcome
+        _dump_or_human(payload=outcome, json_output=json_output)
         return
 
-    if human_lines:
-        for line in human_lines:
-            typer.echo(line)
+    campaigns: list[dict[str, Any]] = []
+    lines: list[str] = []
+    failed: dict[int, EmailBisonError] = {}
+    for cid, outcome in results.items():
+        if isinstance(outcome, EmailBisonError):
+            failed[cid] = outcome
+            campaigns.append(
+                {
+                    "campaign_id": cid,
+                    "error": str(outcome),
+                    "status_code": getattr(outcome, "status_code", None),
+                }
+            )
+            lines.append(f"id={cid} error={outcome}")
+            continue
+        campaigns.append({"campaign_id": cid, "response": outcome})
+        data = outcome.get("data")
+        st = data.get("status") if isinstance(data, dict) else None
+        lines.append(f"id={cid} status={st}")
+
+    _dump_or_human(payload={"campaigns": campaigns}, json_output=json_output, human_lines=lines)
+    if not failed:
         return
 
-    typer.echo(payload)
+    # The other campaigns were still changed; report every failure, then exit non-zero.
+    for cid, e in failed.items():
+        if isinstance(e, ApiError):
+            _echo_api_error(e, prefix=f"Campaign {cid}: ")
+        else:
+            typer.echo(f"Campaign {cid}: {e}", err=True)
+    network_only = all(isinstance(e, NetworkError) for e in failed.values())
+    raise typer.Exit(code=_EXIT_NETWORK if network_only else _EXIT_API)
 
 
 def _coerce_int(value: Any) -> int:
-    if isinstance(value, bool):
-        return int(value)
-    if isinstance(value, (int, float)):
-        return int(value)
-    if isinstance(value, str):
+    # Values come straight from JSON decoding, so exact type checks cover every case
+    # and ints (the common case) return without a conversion.
+    kind = type(value)
+    if kind is int:
+        return value
+    if kind is str:
         try:
             return int(value)
         except ValueError:
@@ -59,305 +121,222 @@ def _coerce_int(value: Any) -> int:
                 return int(float(value))
             except ValueError:
                 return 0
+    if kind is float or kind is bool:
+        return int(value)
     return 0
 
 
-def _extract_metric(data: dict[str, Any], keys: tuple[str, ...]) -> int:
-    for key in keys:
-        if key in data:
-            return _coerce_int(data.get(key))
-    return 0
-
+def _extract_metrics(data: dict[str, Any]) -> dict[str, int]:
+    """Collect every summary metric in one pass over the stats payload."""
+    metrics = dict.fromkeys(_STAT_METRICS, 0)
+    ranks: dict[str, int] = {}
+    for key, value in data.items():
+        field = _STAT_FIELDS.get(key)
+        if field is None:
+            continue
+        metric, rank = field
+        if metric in ranks and ranks[metric] <= rank:
+            continue
+        ranks[metric] = rank
+        metrics[metric] = _coerce_int(value)
+    return metrics
 
-def _format_table(headers: list[str], rows: list[list[str]]) -> list[str]:
-    widths = [len(h) for h in headers]
-    for row in rows:
-        for idx, cell in enumerate(row):
-            widths[idx] = max(widths[idx], len(str(cell)))
 
-    def fmt(row: list[str]) -> str:
-        return " | ".join(str(cell).ljust(widths[idx]) for idx, cell in enumerate(row))
+def _format_table(headers: list[str], rows: list[list[Any]]) -> list[str]:
+    # Stringify every cell once, then size the columns in a single pass over them.
+    str_rows = [[str(cell) for cell in row] for row in (headers, *rows)]
+    widths = [max(map(len, column)) for column in zip(*str_rows, strict=True)]
 
-    sep = "-+-".join("-" * width for width in widths)
-    return [fmt(headers), sep] + [fmt(row) for row in rows]
+    # str.join materializes generators into a list anyway; build the list directly.
+    lines = [
+        " | ".join([cell.ljust(w) for cell, w in zip(row, widths, strict=True)]) for row in str_rows
+    ]
+    lines.insert(1, "-+-".join(["-" * width for width in widths]))
+    return lines
 
 
 @app.command("list")
+@_with_api_error_handling
 def list_campaigns(
     ctx: typer.Context,
     search: str | None = typer.Option(None, "--search"),
     status: str | None = typer.Option(None, "--status"),
     tag_id: list[int] | None = typer.Option(None, "--tag-id", help="Repeatable."),
-    base_url: str | None = typer.Option(None, "--base-url"),
+    ndjson: bool = typer.Option(
+        False, "--ndjson", help="Output one JSON object per row (JSON Lines)."
+    ),
+    base_url: str | None = BASE_URL_OPTION,
 ) -> None:
-    json_output = bool(ctx.obj.get("json")) if ctx.obj else False
-    debug = bool(ctx.obj.get("debug")) if ctx.obj else False
-
-    client = _client_from_env(base_url=base_url, debug=debug)
-    try:
-        raw, _ = client.list_campaigns(search=search, status=status, tag_ids=tag_id or None)
-
-        data = raw.get("data")
-        lines: list[str] = []
-        if isinstance(data, list):
-            for row in data:
-                if not isinstance(row, dict):
-                    continue
-                cid = row.get("id")
-                name = row.get("name")
-                st = row.get("status")
-                lines.append(f"id={cid} status={st} name={name}")
-
-        _dump_or_human(payload=raw, json_output=json_output, human_lines=lines)
-
-    except AuthError as e:
-        typer.echo(str(e), err=True)
-        raise typer.Exit(code=3) from e
-    except NetworkError as e:
-        typer.echo(str(e), err=True)
-        raise typer.Exit(code=4) from e
-    except ApiError as e:
-        typer.echo(f"{e} Details: {json.dumps(e.details, indent=2)}", err=True)
-        raise typer.Exit(code=3) from e
-    finally:
-        client.close()
+    json_output, debug = _ctx_flags(ctx)
+
+    client = _client_from_env(ctx, base_url=base_url, debug=debug)
+    raw, _ = client.list_campaigns(search=search, status=status, tag_ids=_unique_ids(tag_id))
+
+    if ndjson:
+        _dump_ndjson(raw)
+        return
+
+    lines = _format_rows(_LIST_FMT, raw.get("data"))
+
+    _dump_or_human(payload=raw, json_output=json_output, human_lines=lines)
 
 
 @app.command("summary")
+@_with_api_error_handling
 def campaign_summary(
     ctx: typer.Context,
     start_date: str = typer.Option(..., "--start-date", help="YYYY-MM-DD"),
     end_date: str = typer.Option(..., "--end-date", help="YYYY-MM-DD"),
     status: str | None = typer.Option(None, "--status"),
     tag_ids: list[int] | None = typer.Option(None, "--tag-id", help="Repeatable."),
-    base_url: str | None = typer.Option(None, "--base-url"),
+    totals_only: bool = typer.Option(
+        False, "--totals-only", help="Only report the aggregated totals, not per-campaign rows."
+    ),
+    base_url: str | None = BASE_URL_OPTION,
 ) -> None:
     """Aggregate campaign stats across a date range."""
 
-    json_output = bool(ctx.obj.get("json")) if ctx.obj else False
-    debug = bool(ctx.obj.get("debug")) if ctx.obj else False
-
-    client = _client_from_env(base_url=base_url, debug=debug)
-    try:
-        raw, _ = client.list_campaigns(status=status, tag_ids=tag_ids or None)
-        data = raw.get("data")
-        campaigns = [row for row in data if isinstance(row, dict)] if isinstance(data, list) else []
-
-        stat_keys = {
-            "sent": ("emails_sent", "sent"),
-            "delivered": ("emails_delivered", "delivered"),
-            "opened": ("emails_opened", "opened"),
-            "clicked": ("emails_clicked", "clicked"),
-            "replied": ("emails_replied", "replied"),
-            "bounced": ("emails_bounced", "bounced"),
-        }
-
-        totals = {key: 0 for key in stat_keys}
-        rows_payload: list[dict[str, Any]] = []
-        skipped: list[int] = []
-
-        for row in campaigns:
-            campaign_id = row.get("id")
-            if not isinstance(campaign_id, int):
-                typer.echo(f"Warning: skipping campaign with invalid id: {campaign_id}", err=True)
-                continue
-
-            name = row.get("name")
-            status_value = row.get("status")
-
-            try:
-                stats_raw, _ = client.campaign_stats(
-                    campaign_id, start_date=start_date, end_date=end_date
-                )
-            except AuthError as e:
-                typer.echo(
-                    f"Warning: failed to fetch stats for campaign {campaign_id}: {e}",
-                    err=True,
-                )
-                skipped.append(campaign_id)
-                continue
-            except NetworkError as e:
-                typer.echo(
-                    f"Warning: failed to fetch stats for campaign {campaign_id}: {e}",
-                    err=True,
-                )
-                skipped.append(campaign_id)
-                continue
-            except ApiError as e:
-                typer.echo(
-                    f"Warning: failed to fetch stats for campaign {campaign_id}: {e} "
-                    f"Details: {json.dumps(e.details, indent=2)}",
-                    err=True,
-                )
-                skipped.append(campaign_id)
-                continue
-
-            stats_data = stats_raw.get("data")
-            if not isinstance(stats_data, dict):
-                stats_data = {}
-
-            metrics = {key: _extract_metric(stats_data, keys) for key, keys in stat_keys.items()}
-            for key, value in metrics.items():
-                totals[key] += value
-
-            rows_payload.append(
-                {
-                    "campaign_id": campaign_id,
-                    "name": name,
-                    "status": status_value,
-                    **metrics,
-                }
+    json_output, debug = _ctx_flags(ctx)
+
+    tag_ids = _unique_ids(tag_ids)
+
+    client = _client_from_env(ctx, base_url=base_url, debug=debug)
+    raw, _ = client.list_campaigns(status=status, tag_ids=tag_ids)
+    data = raw.get("data")
+
+    # Filter the listing and validate ids in one pass; only fetchable rows are kept.
+    campaigns: list[dict[str, Any]] = []
+    for row in data if isinstance(data, list) else ():
+        if type(row) is not dict:
+            continue
+        campaign_id = row.get("id")
+        if not isinstance(campaign_id, int):
+            typer.echo(f"Warning: skipping campaign with invalid id: {campaign_id}", err=True)
+            continue
+        campaigns.append(row)
+
+    stats_by_id = client.campaign_stats_bulk(
+        [row["id"] for row in campaigns],
+        start_date=start_date,
+        end_date=end_date,
+    )
+
+    totals = dict.fromkeys(_STAT_METRICS, 0)
+    rows_payload: list[dict[str, Any]] = []
+    skipped: list[int] = []
+
+    for row in campaigns:
+        campaign_id = row["id"]
+        stats_raw = stats_by_id[campaign_id]
+        if isinstance(stats_raw, ApiError):
+            _echo_api_error(
+                stats_raw,
+                prefix=f"Warning: failed to fetch stats for campaign {campaign_id}: ",
             )
+            skipped.append(campaign_id)
+            continue
+        if isinstance(stats_raw, EmailBisonError):
+            typer.echo(
+                f"Warning: failed to fetch stats for campaign {campaign_id}: {stats_raw}",
+                err=True,
+            )
+            skipped.append(campaign_id)
+            continue
+
+        stats_data = stats_raw.get("data")
+        if not isinstance(stats_data, dict):
+            stats_data = {}
+
+        metrics = _extract_metrics(stats_data)
+        for key in _STAT_METRICS:
+            totals[key] += metrics[key]
+
+        if totals_only:
+            continue
+        rows_payload.append(
+            {
+                "campaign_id": campaign_id,
+                "name": row.get("name"),
+                "status": row.get("status"),
+                **metrics,
+            }
+        )
 
-        payload = {
-            "start_date": start_date,
-            "end_date": end_date,
-            "status": status,
-            "tag_ids": tag_ids or None,
-            "campaigns": rows_payload,
-            "summary": totals,
-            "skipped_campaign_ids": skipped,
-        }
+    payload: dict[str, Any] = {
+        "start_date": start_date,
+        "end_date": end_date,
+        "status": status,
+        "tag_ids": tag_ids,
+    }
+    if not totals_only:
+        payload["campaigns"] = rows_payload
+    payload["summary"] = totals
+    payload["skipped_campaign_ids"] = skipped
 
-        if json_output:
-            typer.echo(json.dumps(payload, indent=2))
-        else:
-            headers = [
-                "campaign_id",
-                "name",
-                "status",
-                "sent",
-                "delivered",
-                "opened",
-                "clicked",
-                "replied",
-                "bounced",
+    if json_output:
+        jsonio.dump(payload, sys.stdout)
+    else:
+        headers = ["campaign_id", "name", "status", *_STAT_METRICS]
+        table_rows = [
+            [
+                row["campaign_id"],
+                row["name"] or "",
+                row["status"] or "",
+                *(row[key] for key in _STAT_METRICS),
             ]
-            table_rows: list[list[str]] = []
-            for row in rows_payload:
-                table_rows.append(
-                    [
-                        str(row.get("campaign_id", "")),
-                        str(row.get("name") or ""),
-                        str(row.get("status") or ""),
-                        str(row.get("sent", 0)),
-                        str(row.get("delivered", 0)),
-                        str(row.get("opened", 0)),
-                        str(row.get("clicked", 0)),
-                        str(row.get("replied", 0)),
-                        str(row.get("bounced", 0)),
-                    ]
-                )
-
-            table_rows.append(
-                [
-                    "TOTAL",
-                    "",
-                    "",
-                    str(totals["sent"]),
-                    str(totals["delivered"]),
-                    str(totals["opened"]),
-                    str(totals["clicked"]),
-                    str(totals["replied"]),
-                    str(totals["bounced"]),
-                ]
-            )
+            for row in rows_payload
+        ]
+        table_rows.append(["TOTAL", "", "", *(totals[key] for key in _STAT_METRICS)])
 
-            for line in _format_table(headers, table_rows):
-                typer.echo(line)
-
-    except AuthError as e:
-        typer.echo(str(e), err=True)
-        raise typer.Exit(code=3) from e
-    except NetworkError as e:
-        typer.echo(str(e), err=True)
-        raise typer.Exit(code=4) from e
-    except ApiError as e:
-        typer.echo(f"{e} Details: {json.dumps(e.details, indent=2)}", err=True)
-        raise typer.Exit(code=3) from e
-    finally:
-        client.close()
+        typer.echo("\n".join(_format_table(headers, table_rows)))
 
 
 @app.command("get")
+@_with_api_error_handling
 def get_campaign(
     ctx: typer.Context,
     campaign_id: int = typer.Argument(...),
-    base_url: str | None = typer.Option(None, "--base-url"),
+    base_url: str | None = BASE_URL_OPTION,
 ) -> None:
-    json_output = bool(ctx.obj.get("json")) if ctx.obj else False
-    debug = bool(ctx.obj.get("debug")) if ctx.obj else False
-
-    client = _client_from_env(base_url=base_url, debug=debug)
-    try:
-        raw, _ = client.campaign_details(campaign_id)
-        _dump_or_human(payload=raw, json_output=json_output)
-    except AuthError as e:
-        typer.echo(str(e), err=True)
-        raise typer.Exit(code=3) from e
-    except NetworkError as e:
-        typer.echo(str(e), err=True)
-        raise typer.Exit(code=4) from e
-    except ApiError as e:
-        typer.echo(f"{e} Details: {json.dumps(e.details, indent=2)}", err=True)
-        raise typer.Exit(code=3) from e
-    finally:
-        client.close()
+    json_output, debug = _ctx_flags(ctx)
+
+    client = _client_from_env(ctx, base_url=base_url, debug=debug)
+    raw, _ = client.campaign_details(campaign_id)
+    _dump_or_human(payload=raw, json_output=json_output)
 
 
 @app.command("pause")
+@_with_api_error_handling
 def pause_campaign(
     ctx: typer.Context,
-    campaign_id: int = typer.Argument(...),
-    base_url: str | None = typer.Option(None, "--base-url"),
+    campaign_id: list[int] = typer.Argument(..., help="One or more campaign ids."),
+    base_url: str | None = BASE_URL_OPTION,
 ) -> None:
-    json_output = bool(ctx.obj.get("json")) if ctx.obj else False
-    debug = bool(ctx.obj.get("debug")) if ctx.obj else False
-
-    client = _client_from_env(base_url=base_url, debug=debug)
-    try:
-        raw, _ = client.pause_campaign(campaign_id)
-        _dump_or_human(payload=raw, json_output=json_output)
-    except AuthError as e:
-        typer.echo(str(e), err=True)
-        raise typer.Exit(code=3) from e
-    except NetworkError as e:
-        typer.echo(str(e), err=True)
-        raise typer.Exit(code=4) from e
-    except ApiError as e:
-        typer.echo(f"{e} Details: {json.dumps(e.details, indent=2)}", err=True)
-        raise typer.Exit(code=3) from e
-    finally:
-        client.close()
+    json_output, debug = _ctx_flags(ctx)
+
+    client = _client_from_env(ctx, base_url=base_url, debug=debug)
+    ids = _require_non_empty_int_list(campaign_id, what="campaign id")
+    results = client.pause_campaigns(ids)
+    _dump_lifecycle(results=results, json_output=json_output)
 
 
 @app.command("resume")
+@_with_api_error_handling
 def resume_campaign(
     ctx: typer.Context,
-    campaign_id: int = typer.Argument(...),
-    base_url: str | None = typer.Option(None, "--base-url"),
+    campaign_id: list[int] = typer.Argument(..., help="One or more campaign ids."),
+    base_url: str | None = BASE_URL_OPTION,
 ) -> None:
-    json_output = bool(ctx.obj.get("json")) if ctx.obj else False
-    debug = bool(ctx.obj.get("debug")) if ctx.obj else False
-
-    client = _client_from_env(base_url=base_url, debug=debug)
-    try:
-        raw, _ = client.resume_campaign(campaign_id)
-        _dump_or_human(payload=raw, json_output=json_output)
-    except AuthError as e:
-        typer.echo(str(e), err=True)
-        raise typer.Exit(code=3) from e
-    except NetworkError as e:
-        typer.echo(str(e), err=True)
-        raise typer.Exit(code=4) from e
-    except ApiError as e:
-        typer.echo(f"{e} Details: {json.dumps(e.details, indent=2)}", err=True)
-        raise typer.Exit(code=3) from e
-    finally:
-        client.close()
+    json_output, debug = _ctx_flags(ctx)
+
+    client = _client_from_env(ctx, base_url=base_url, debug=debug)
+    ids = _require_non_empty_int_list(campaign_id, what="campaign id")
+    results = client.resume_campaigns(ids)
+    _dump_lifecycle(results=results, json_output=json_output)
 
 
 @app.command("start")
+@_with_api_error_handling
 def start_campaign(
     ctx: typer.Context,
     campaign_id: int = typer.Argument(...),
@@ -366,170 +345,137 @@ def start_campaign(
         "--force",
         help="Skip preflight checks (unsafe).",
     ),
-    base_url: str | None = typer.Option(None, "--base-url"),
+    base_url: str | None = BASE_URL_OPTION,
 ) -> None:
     """Start a campaign (maps to resume). Performs basic safety checks by default."""
 
-    json_output = bool(ctx.obj.get("json")) if ctx.obj else False
-    debug = bool(ctx.obj.get("debug")) if ctx.obj else False
-
-    client = _client_from_env(base_url=base_url, debug=debug)
-    try:
-        missing: list[str] = []
-
-        details_raw, _ = client.campaign_details(campaign_id)
-        data = details_raw.get("data")
-        total_leads = None
-        sequence_id = None
-        status = None
-        if isinstance(data, dict):
-            if isinstance(data.get("total_leads"), int):
-                total_leads = int(data.get("total_leads"))
-            if isinstance(data.get("sequence_id"), int):
-                sequence_id = int(data.get("sequence_id"))
-            if isinstance(data.get("status"), str):
-                status = str(data.get("status"))
-
-        if not total_leads:
-            missing.append("no leads attached")
-
-        senders_raw, _ = client.get_campaign_sender_emails(campaign_id)
-        sender_count = 0
-        if isinstance(senders_raw.get("data"), list):
-            sender_count = len(senders_raw.get("data"))
-        if sender_count == 0:
-            missing.append("no sender emails attached")
-
-        seq_raw, _ = client.get_sequence_steps_v11(campaign_id)
-        step_count = 0
-        seq_data = seq_raw.get("data")
-        if isinstance(seq_data, dict) and isinstance(seq_data.get("sequence_steps"), list):
-            step_count = len(seq_data.get("sequence_steps"))
-        if step_count == 0:
-            missing.append("no sequence steps")
-
-        preflight = {
-            "ok": len(missing) == 0,
-            "missing": missing,
-            "campaign": {
-                "id": campaign_id,
-                "status": status,
-                "sequence_id": sequence_id,
-                "total_leads": total_leads,
-            },
-            "sender_emails_count": sender_count,
-            "sequence_steps_count": step_count,
-        }
-
-        if missing and not force:
-            if json_output:
-                typer.echo(json.dumps({"preflight": preflight}, indent=2))
-            else:
-                typer.echo(
-                    "Refusing to start campaign (preflight failed): " + ", ".join(missing),
-                    err=True,
-                )
-            raise typer.Exit(code=2)
-
-        resume_raw, _ = client.resume_campaign(campaign_id)
-        details_after_raw, _ = client.campaign_details(campaign_id)
-
-        payload = {
-            "preflight": preflight,
-            "resume": resume_raw,
-            "campaign": details_after_raw,
-        }
-
+    json_output, debug = _ctx_flags(ctx)
+
+    client = _client_from_env(ctx, base_url=base_url, debug=debug)
+    missing: list[str] = []
+
+    # The three preflight reads are independent; issue them concurrently.
+    with ThreadPoolExecutor(max_workers=3) as ex:
+        details_future = ex.submit(client.campaign_details, campaign_id)
+        senders_future = ex.submit(client.get_campaign_sender_emails, campaign_id)
+        seq_future = ex.submit(client.get_sequence_steps_v11, campaign_id)
+    details_raw, _ = details_future.result()
+    senders_raw, _ = senders_future.result()
+    seq_raw, _ = seq_future.result()
+
+    data = details_raw.get("data")
+    total_leads = None
+    sequence_id = None
+    status = None
+    if isinstance(data, dict):
+        if isinstance(data.get("total_leads"), int):
+            total_leads = int(data.get("total_leads"))
+        if isinstance(data.get("sequence_id"), int):
+            sequence_id = int(data.get("sequence_id"))
+        if isinstance(data.get("status"), str):
+            status = str(data.get("status"))
+
+    if not total_leads:
+        missing.append("no leads attached")
+
+    sender_count = 0
+    if isinstance(senders_raw.get("data"), list):
+        sender_count = len(senders_raw.get("data"))
+    if sender_count == 0:
+        missing.append("no sender emails attached")
+
+    step_count = 0
+    seq_data = seq_raw.get("data")
+    if isinstance(seq_data, dict) and isinstance(seq_data.get("sequence_steps"), list):
+        step_count = len(seq_data.get("sequence_steps"))
+    if step_count == 0:
+        missing.append("no sequence steps")
+
+    preflight = {
+        "ok": len(missing) == 0,
+        "missing": missing,
+        "campaign": {
+            "id": campaign_id,
+            "status": status,
+            "sequence_id": sequence_id,
+            "total_leads": total_leads,
+        },
+        "sender_emails_count": sender_count,
+        "sequence_steps_count": step_count,
+    }
+
+    if missing and not force:
         if json_output:
-            typer.echo(json.dumps(payload, indent=2))
+            jsonio.dump({"preflight": preflight}, sys.stdout)
         else:
-            new_status = None
-            d2 = details_after_raw.get("data")
-            if isinstance(d2, dict) and isinstance(d2.get("status"), str):
-                new_status = str(d2.get("status"))
-            typer.echo(f"id={campaign_id} started=true status={new_status or 'unknown'}")
-
-    except AuthError as e:
-        typer.echo(str(e), err=True)
-        raise typer.Exit(code=3) from e
-    except NetworkError as e:
-        typer.echo(str(e), err=True)
-        raise typer.Exit(code=4) from e
-    except ApiError as e:
-        typer.echo(f"{e} Details: {json.dumps(e.details, indent=2)}", err=True)
-        raise typer.Exit(code=3) from e
-    finally:
-        client.close()
+            typer.echo(
+                "Refusing to start campaign (preflight failed): " + ", ".join(missing),
+                err=True,
+            )
+        raise typer.Exit(code=_EXIT_USAGE)
+
+    resume_raw, _ = client.resume_campaign(campaign_id)
+    details_after_raw, _ = client.campaign_details(campaign_id)
+
+    payload = {
+        "preflight": preflight,
+        "resume": resume_raw,
+        "campaign": details_after_raw,
+    }
+
+    if json_output:
+        jsonio.dump(payload, sys.stdout)
+    else:
+        new_status = None
+        d2 = details_after_raw.get("data")
+        if isinstance(d2, dict) and isinstance(d2.get("status"), str):
+            new_status = str(d2.get("status"))
+        typer.echo(f"id={campaign_id} started=true status={new_status or 'unknown'}")
 
 
 @app.command("archive")
+@_with_api_error_handling
 def archive_campaign(
     ctx: typer.Context,
-    campaign_id: int = typer.Argument(...),
-    base_url: str | None = typer.Option(None, "--base-url"),
+    campaign_id: list[int] = typer.Argument(..., help="One or more campaign ids."),
+    base_url: str | None = BASE_URL_OPTION,
 ) -> None:
-    json_output = bool(ctx.obj.get("json")) if ctx.obj else False
-    debug = bool(ctx.obj.get("debug")) if ctx.obj else False
-
-    client = _client_from_env(base_url=base_url, debug=debug)
-    try:
-        raw, _ = client.archive_campaign(campaign_id)
-        _dump_or_human(payload=raw, json_output=json_output)
-    except AuthError as e:
-        typer.echo(str(e), err=True)
-        raise typer.Exit(code=3) from e
-    except NetworkError as e:
-        typer.echo(str(e), err=True)
-        raise typer.Exit(code=4) from e
-    except ApiError as e:
-        typer.echo(f"{e} Details: {json.dumps(e.details, indent=2)}", err=True)
-        raise typer.Exit(code=3) from e
-    finally:
-        client.close()
+    json_output, debug = _ctx_flags(ctx)
+
+    client = _client_from_env(ctx, base_url=base_url, debug=debug)
+    ids = _require_non_empty_int_list(campaign_id, what="campaign id")
+    results = client.archive_campaigns(ids)
+    _dump_lifecycle(results=results, json_output=json_output)
 
 
 @app.command("sender-emails")
+@_with_api_error_handling
 def campaign_sender_emails(
     ctx: typer.Context,
     campaign_id: int = typer.Argument(...),
-    base_url: str | None = typer.Option(None, "--base-url"),
+    ndjson: bool = typer.Option(
+        False, "--ndjson", help="Output one JSON object per row (JSON Lines)."
+    ),
+    base_url: str | None = BASE_URL_OPTION,
 ) -> None:
     """List sender email accounts attached to a campaign."""
 
-    json_output = bool(ctx.obj.get("json")) if ctx.obj else False
-    debug = bool(ctx.obj.get("debug")) if ctx.obj else False
-
-    client = _client_from_env(base_url=base_url, debug=debug)
-    try:
-        raw, _ = client.get_campaign_sender_emails(campaign_id)
-
-        data = raw.get("data")
-        lines: list[str] = []
-        if isinstance(data, list):
-            for row in data:
-                if not isinstance(row, dict):
-                    continue
-                sid = row.get("id")
-                email = row.get("email")
-                status = row.get("status")
-                lines.append(f"id={sid} status={status} email={email}")
-
-        _dump_or_human(payload=raw, json_output=json_output, human_lines=lines)
-
-    except AuthError as e:
-        typer.echo(str(e), err=True)
-        raise typer.Exit(code=3) from e
-    except NetworkError as e:
-        typer.echo(str(e), err=True)
-        raise typer.Exit(code=4) from e
-    except ApiError as e:
-        typer.echo(f"{e} Details: {json.dumps(e.details, indent=2)}", err=True)
-        raise typer.Exit(code=3) from e
-    finally:
-        client.close()
+    json_output, debug = _ctx_flags(ctx)
+
+    client = _client_from_env(ctx, base_url=base_url, debug=debug)
+    raw, _ = client.get_campaign_sender_emails(campaign_id)
+
+    if ndjson:
+        _dump_ndjson(raw)
+        return
+
+    lines = _format_rows(_SENDER_FMT, raw.get("data"))
+
+    _dump_or_human(payload=raw, json_output=json_output, human_lines=lines)
 
 
 @app.command("attach-sender-emails")
+@_with_api_error_handling
 def attach_sender_emails(
     ctx: typer.Context,
     campaign_id: int = typer.Argument(...),
@@ -538,33 +484,21 @@ def attach_sender_emails(
         "--sender-email-id",
         help="Repeatable sender email id to attach.",
     ),
-    base_url: str | None = typer.Option(None, "--base-url"),
+    base_url: str | None = BASE_URL_OPTION,
 ) -> None:
     """Attach sender email accounts to a campaign."""
 
-    json_output = bool(ctx.obj.get("json")) if ctx.obj else False
-    debug = bool(ctx.obj.get("debug")) if ctx.obj else False
+    json_output, debug = _ctx_flags(ctx)
 
     ids = _require_non_empty_int_list(sender_email_id, what="--sender-email-id")
 
-    client = _client_from_env(base_url=base_url, debug=debug)
-    try:
-        raw, _ = client.attach_sender_emails(campaign_id, sender_email_ids=ids)
-        _dump_or_human(payload=raw, json_output=json_output)
-    except AuthError as e:
-        typer.echo(str(e), err=True)
-        raise typer.Exit(code=3) from e
-    except NetworkError as e:
-        typer.echo(str(e), err=True)
-        raise typer.Exit(code=4) from e
-    except ApiError as e:
-        typer.echo(f"{e} Details: {json.dumps(e.details, indent=2)}", err=True)
-        raise typer.Exit(code=3) from e
-    finally:
-        client.close()
+    client = _client_from_env(ctx, base_url=base_url, debug=debug)
+    raw, _ = client.attach_sender_emails(campaign_id, sender_email_ids=ids)
+    _dump_or_human(payload=raw, json_output=json_output)
 
 
 @app.command("remove-sender-emails")
+@_with_api_error_handling
 def remove_sender_emails(
     ctx: typer.Context,
     campaign_id: int = typer.Argument(...),
@@ -573,63 +507,39 @@ def remove_sender_emails(
         "--sender-email-id",
         help="Repeatable sender email id to remove.",
     ),
-    base_url: str | None = typer.Option(None, "--base-url"),
+    base_url: str | None = BASE_URL_OPTION,
 ) -> None:
     """Remove sender email accounts from a campaign (draft/paused only)."""
 
-    json_output = bool(ctx.obj.get("json")) if ctx.obj else False
-    debug = bool(ctx.obj.get("debug")) if ctx.obj else False
+    json_output, debug = _ctx_flags(ctx)
 
     ids = _require_non_empty_int_list(sender_email_id, what="--sender-email-id")
 
-    client = _client_from_env(base_url=base_url, debug=debug)
-    try:
-        raw, _ = client.remove_sender_emails(campaign_id, sender_email_ids=ids)
-        _dump_or_human(payload=raw, json_output=json_output)
-    except AuthError as e:
-        typer.echo(str(e), err=True)
-        raise typer.Exit(code=3) from e
-    except NetworkError as e:
-        typer.echo(str(e), err=True)
-        raise typer.Exit(code=4) from e
-    except ApiError as e:
-        typer.echo(f"{e} Details: {json.dumps(e.details, indent=2)}", err=True)
-        raise typer.Exit(code=3) from e
-    finally:
-        client.close()
+    client = _client_from_env(ctx, base_url=base_url, debug=debug)
+    raw, _ = client.remove_sender_emails(campaign_id, sender_email_ids=ids)
+    _dump_or_human(payload=raw, json_output=json_output)
 
 
 @app.command("stats")
+@_with_api_error_handling
 def campaign_stats(
     ctx: typer.Context,
     campaign_id: int = typer.Argument(...),
     start_date: str = typer.Option(..., "--start-date", help="YYYY-MM-DD"),
     end_date: str = typer.Option(..., "--end-date", help="YYYY-MM-DD"),
-    base_url: str | None = typer.Option(None, "--base-url"),
+    base_url: str | None = BASE_URL_OPTION,
 ) -> None:
     """Get campaign stats summary for a date range."""
 
-    json_output = bool(ctx.obj.get("json")) if ctx.obj else False
-    debug = bool(ctx.obj.get("debug")) if ctx.obj else False
-
-    client = _client_from_env(base_url=base_url, debug=debug)
-    try:
-        raw, _ = client.campaign_stats(campaign_id, start_date=start_date, end_date=end_date)
-        _dump_or_human(payload=raw, json_output=json_output)
-    except AuthError as e:
-        typer.echo(str(e), err=True)
-        raise typer.Exit(code=3) from e
-    except NetworkError as e:
-        typer.echo(str(e), err=True)
-        raise typer.Exit(code=4) from e
-    except ApiError as e:
-        typer.echo(f"{e} Details: {json.dumps(e.details, indent=2)}", err=True)
-        raise typer.Exit(code=3) from e
-    finally:
-        client.close()
+    json_output, debug = _ctx_flags(ctx)
+
+    client = _client_from_env(ctx, base_url=base_url, debug=debug)
+    raw, _ = client.campaign_stats(campaign_id, start_date=start_date, end_date=end_date)
+    _dump_or_human(payload=raw, json_output=json_output)
 
 
 @app.command("replies")
+@_with_api_error_handling
 def campaign_replies(
     ctx: typer.Context,
     campaign_id: int = typer.Argument(...),
@@ -640,53 +550,38 @@ def campaign_replies(
     sender_email_id: int | None = typer.Option(None, "--sender-email-id"),
     lead_id: int | None = typer.Option(None, "--lead-id"),
     tag_id: list[int] | None = typer.Option(None, "--tag-id", help="Repeatable."),
-    base_url: str | None = typer.Option(None, "--base-url"),
+    ndjson: bool = typer.Option(
+        False, "--ndjson", help="Output one JSON object per row (JSON Lines)."
+    ),
+    base_url: str | None = BASE_URL_OPTION,
 ) -> None:
     """List replies for a campaign."""
 
-    json_output = bool(ctx.obj.get("json")) if ctx.obj else False
-    debug = bool(ctx.obj.get("debug")) if ctx.obj else False
-
-    client = _client_from_env(base_url=base_url, debug=debug)
-    try:
-        raw, _ = client.campaign_replies(
-            campaign_id,
-            search=search,
-            status=status,
-            folder=folder,
-            read=read,
-            sender_email_id=sender_email_id,
-            lead_id=lead_id,
-            tag_ids=tag_id or None,
-        )
+    json_output, debug = _ctx_flags(ctx)
+
+    client = _client_from_env(ctx, base_url=base_url, debug=debug)
+    raw, _ = client.campaign_replies(
+        campaign_id,
+        search=search,
+        status=status,
+        folder=folder,
+        read=read,
+        sender_email_id=sender_email_id,
+        lead_id=lead_id,
+        tag_ids=_unique_ids(tag_id),
+    )
+
+    if ndjson:
+        _dump_ndjson(raw)
+        return
+
+    lines = _format_rows(_REPLY_FMT, raw.get("data"))
 
-        data = raw.get("data")
-        lines: list[str] = []
-        if isinstance(data, list):
-            for row in data:
-                if not isinstance(row, dict):
-                    continue
-                rid = row.get("id")
-                subj = row.get("subject")
-                frm = row.get("from_email_address")
-                lines.append(f"id={rid} from={frm} subject={subj}")
-
-        _dump_or_human(payload=raw, json_output=json_output, human_lines=lines)
-
-    except AuthError as e:
-        typer.echo(str(e), err=True)
-        raise typer.Exit(code=3) from e
-    except NetworkError as e:
-        typer.echo(str(e), err=True)
-        raise typer.Exit(code=4) from e
-    except ApiError as e:
-        typer.echo(f"{e} Details: {json.dumps(e.details, indent=2)}", err=True)
-        raise typer.Exit(code=3) from e
-    finally:
-        client.close()
+    _dump_or_human(payload=raw, json_output=json_output, human_lines=lines)
 
 
 @app.command("stop-future-emails")
+@_with_api_error_handling
 def stop_future_emails(
     ctx: typer.Context,
     campaign_id: int = typer.Argument(...),
@@ -695,27 +590,14 @@ def stop_future_emails(
         "--lead-id",
         help="Repeatable lead id.",
     ),
-    base_url: str | None = typer.Option(None, "--base-url"),
+    base_url: str | None = BASE_URL_OPTION,
 ) -> None:
     """Stop future emails for selected leads in a campaign."""
 
-    json_output = bool(ctx.obj.get("json")) if ctx.obj else False
-    debug = bool(ctx.obj.get("debug")) if ctx.obj else False
+    json_output, debug = _ctx_flags(ctx)
 
     lead_ids = _require_non_empty_int_list(lead_id, what="--lead-id")
 
-    client = _client_from_env(base_url=base_url, debug=debug)
-    try:
-        raw, _ = client.stop_future_emails_for_leads(campaign_id, lead_ids=lead_ids)
-        _dump_or_human(payload=raw, json_output=json_output)
-    except AuthError as e:
-        typer.echo(str(e), err=True)
-        raise typer.Exit(code=3) from e
-    except NetworkError as e:
-        typer.echo(str(e), err=True)
-        raise typer.Exit(code=4) from e
-    except ApiError as e:
-        typer.echo(f"{e} Details: {json.dumps(e.details, indent=2)}", err=True)
-        raise typer.Exit(code=3) from e
-    finally:
-        client.close()
+    client = _client_from_env(ctx, base_url=base_url, debug=debug)
+    raw, _ = client.stop_future_emails_for_leads(campaign_id, lead_ids=lead_ids)
+    _dump_or_human(payload=raw, json_output=json_output)
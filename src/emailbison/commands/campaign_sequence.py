@@ -1,177 +1,119 @@
 from __future__ import annotations
 
-import json
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, TypeVar
 
 import typer
 
-from ..client import ApiError, AuthError, EmailBisonClient, NetworkError
-from ..config import ConfigError, load_settings
-from ..models import SequenceSpec, SequenceUpdateSpec
+from ._shared import (
+    _EXIT_USAGE,
+    BASE_URL_OPTION,
+    _client_from_env,
+    _ctx_flags,
+    _dump_or_human,
+    _format_rows,
+    _with_api_error_handling,
+)
+
+if TYPE_CHECKING:
+    from pydantic import BaseModel
+
+_SpecT = TypeVar("_SpecT", bound="BaseModel")
 
 app = typer.Typer(add_completion=False)
 
+_STEP_FMT = "step_id={id} order={order} wait_in_days={wait_in_days} subject={email_subject}"
 
-def _client_from_env(*, base_url: str | None, debug: bool) -> EmailBisonClient:
-    try:
-        settings = load_settings(base_url=base_url)
-    except ConfigError as e:
-        typer.echo(str(e), err=True)
-        raise typer.Exit(code=3) from e
-    return EmailBisonClient(settings, debug=debug)
-
-
-def _dump_or_human(
-    *,
-    payload: dict[str, Any],
-    json_output: bool,
-    human_lines: list[str] | None = None,
-) -> None:
-    if json_output:
-        typer.echo(json.dumps(payload, indent=2))
-        return
 
-    if human_lines:
-        for line in human_lines:
-            typer.echo(line)
-        return
+def _read_json_file(path: Path) -> bytes:
+    try:
+        return path.read_bytes()
+    except FileNotFoundError as e:
+        typer.echo(f"File not found: {path}", err=True)
+        raise typer.Exit(code=_EXIT_USAGE) from e
 
-    typer.echo(payload)
 
+def _load_spec(model: type[_SpecT], path: Path) -> _SpecT:
+    # Validate the raw bytes directly; pydantic parses the JSON itself, which skips
+    # the json.loads -> dict -> model_validate round-trip.
+    from pydantic import ValidationError
 
-def _load_json_file(path: Path) -> dict[str, Any]:
-    if not path.exists():
-        typer.echo(f"File not found: {path}", err=True)
-        raise typer.Exit(code=2)
     try:
-        data = json.loads(path.read_text(encoding="utf-8"))
-    except json.JSONDecodeError as e:
-        typer.echo(f"Invalid JSON in {path}: {e}", err=True)
-        raise typer.Exit(code=2) from e
-    if not isinstance(data, dict):
-        typer.echo("File must contain a JSON object at the top level", err=True)
-        raise typer.Exit(code=2)
-    return data
+        return model.model_validate_json(_read_json_file(path))
+    except ValidationError as e:
+        typer.echo(f"Validation error in {path}: {e}", err=True)
+        raise typer.Exit(code=_EXIT_USAGE) from e
 
 
 @app.command("get")
+@_with_api_error_handling
 def sequence_get(
     ctx: typer.Context,
     campaign_id: int = typer.Argument(...),
-    base_url: str | None = typer.Option(None, "--base-url"),
+    base_url: str | None = BASE_URL_OPTION,
 ) -> None:
     """Get the sequence steps for a campaign (v1.1)."""
 
-    json_output = bool(ctx.obj.get("json")) if ctx.obj else False
-    debug = bool(ctx.obj.get("debug")) if ctx.obj else False
+    json_output, debug = _ctx_flags(ctx)
 
-    client = _client_from_env(base_url=base_url, debug=debug)
-    try:
-        raw, _ = client.get_sequence_steps_v11(campaign_id)
-
-        lines: list[str] = []
-        data = raw.get("data")
-        if isinstance(data, dict):
-            seq_id = data.get("sequence_id")
-            if seq_id is not None:
-                lines.append(f"sequence_id={seq_id}")
-
-            steps = data.get("sequence_steps")
-            if isinstance(steps, list):
-                for step in steps:
-                    if not isinstance(step, dict):
-                        continue
-                    sid = step.get("id")
-                    order = step.get("order")
-                    wait = step.get("wait_in_days")
-                    subj = step.get("email_subject")
-                    lines.append(f"step_id={sid} order={order} wait_in_days={wait} subject={subj}")
-
-        _dump_or_human(payload=raw, json_output=json_output, human_lines=lines)
-
-    except AuthError as e:
-        typer.echo(str(e), err=True)
-        raise typer.Exit(code=3) from e
-    except NetworkError as e:
-        typer.echo(str(e), err=True)
-        raise typer.Exit(code=4) from e
-    except ApiError as e:
-        typer.echo(f"{e} Details: {json.dumps(e.details, indent=2)}", err=True)
-        raise typer.Exit(code=3) from e
-    finally:
-        client.close()
+    client = _client_from_env(ctx, base_url=base_url, debug=debug)
+    raw, _ = client.get_sequence_steps_v11(campaign_id)
+
+    lines: list[str] = []
+    data = raw.get("data")
+    if isinstance(data, dict):
+        seq_id = data.get("sequence_id")
+        if seq_id is not None:
+            lines.append(f"sequence_id={seq_id}")
+
+        lines += _format_rows(_STEP_FMT, data.get("sequence_steps"))
+
+    _dump_or_human(payload=raw, json_output=json_output, human_lines=lines)
 
 
 @app.command("set")
+@_with_api_error_handling
 def sequence_set(
     ctx: typer.Context,
     campaign_id: int = typer.Argument(...),
     file: Path = typer.Option(..., "--file", help="JSON file containing {title, sequence_steps}."),
-    base_url: str | None = typer.Option(None, "--base-url"),
+    base_url: str | None = BASE_URL_OPTION,
 ) -> None:
     """Create sequence steps from scratch for a campaign (v1.1)."""
 
-    json_output = bool(ctx.obj.get("json")) if ctx.obj else False
-    debug = bool(ctx.obj.get("debug")) if ctx.obj else False
+    json_output, debug = _ctx_flags(ctx)
 
-    spec = SequenceSpec.model_validate(_load_json_file(file))
+    from ..models import SequenceSpec
 
-    client = _client_from_env(base_url=base_url, debug=debug)
-    try:
-        steps = [s.model_dump(exclude_none=True) for s in spec.sequence_steps]
-        raw, _ = client.create_sequence_steps_v11(
-            campaign_id,
-            {"title": spec.title, "sequence_steps": steps},
-        )
-        _dump_or_human(payload=raw, json_output=json_output)
-
-    except AuthError as e:
-        typer.echo(str(e), err=True)
-        raise typer.Exit(code=3) from e
-    except NetworkError as e:
-        typer.echo(str(e), err=True)
-        raise typer.Exit(code=4) from e
-    except ApiError as e:
-        typer.echo(f"{e} Details: {json.dumps(e.details, indent=2)}", err=True)
-        raise typer.Exit(code=3) from e
-    finally:
-        client.close()
+    spec = _load_spec(SequenceSpec, file)
+
+    client = _client_from_env(ctx, base_url=base_url, debug=debug)
+    raw, _ = client.create_sequence_steps_v11(
+        campaign_id, spec.model_dump_json(exclude_none=True).encode()
+    )
+    _dump_or_human(payload=raw, json_output=json_output)
 
 
 @app.command("update")
+@_with_api_error_handling
 def sequence_update(
     ctx: typer.Context,
     sequence_id: int = typer.Argument(..., help="Sequence id (see `sequence get`)."),
     file: Path = typer.Option(
         ..., "--file", help="JSON file containing {title, sequence_steps:[{id,...}]}."
     ),
-    base_url: str | None = typer.Option(None, "--base-url"),
+    base_url: str | None = BASE_URL_OPTION,
 ) -> None:
     """Update an existing sequence (v1.1)."""
 
-    json_output = bool(ctx.obj.get("json")) if ctx.obj else False
-    debug = bool(ctx.obj.get("debug")) if ctx.obj else False
+    json_output, debug = _ctx_flags(ctx)
 
-    spec = SequenceUpdateSpec.model_validate(_load_json_file(file))
+    from ..models import SequenceUpdateSpec
 
-    client = _client_from_env(base_url=base_url, debug=debug)
-    try:
-        steps = [s.model_dump(exclude_none=True) for s in spec.sequence_steps]
-        raw, _ = client.update_sequence_steps_v11(
-            sequence_id,
-            {"title": spec.title, "sequence_steps": steps},
-        )
-        _dump_or_human(payload=raw, json_output=json_output)
-
-    except AuthError as e:
-        typer.echo(str(e), err=True)
-        raise typer.Exit(code=3) from e
-    except NetworkError as e:
-        typer.echo(str(e), err=True)
-        raise typer.Exit(code=4) from e
-    except ApiError as e:
-        typer.echo(f"{e} Details: {json.dumps(e.details, indent=2)}", err=True)
-        raise typer.Exit(code=3) from e
-    finally:
-        client.close()
+    spec = _load_spec(SequenceUpdateSpec, file)
+
+    client = _client_from_env(ctx, base_url=base_url, debug=debug)
+    raw, _ = client.update_sequence_steps_v11(
+        sequence_id, spec.model_dump_json(exclude_none=True).encode()
+    )
+    _dump_or_human(payload=raw, json_output=json_output)
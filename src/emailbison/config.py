@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import os
 import pathlib
 import tomllib
@@ -9,7 +10,7 @@ from typing import Any
 from platformdirs import user_config_dir
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Settings:
     base_url: str = "https://dedi.emailbison.com"
     api_token: str = ""
@@ -28,10 +29,22 @@ class ConfigError(RuntimeError):
 
 
 def _load_toml(path: pathlib.Path) -> dict[str, Any]:
-    if not path.exists():
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except FileNotFoundError:
         return {}
+    return _parse_toml(path, mtime_ns)
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_toml(path: pathlib.Path, mtime_ns: int) -> dict[str, Any]:
+    # Keyed on mtime so an edited file is re-read; callers must not mutate the result.
     try:
-        data = tomllib.loads(path.read_text(encoding="utf-8"))
+        with path.open("rb") as f:
+            data = tomllib.load(f)
+    except FileNotFoundError:
+        # Removed between the stat in _load_toml and this read.
+        return {}
     except Exception as e:  # pragma: no cover
         raise ConfigError(f"Failed to parse config TOML: {path}: {e}") from e
     if not isinstance(data, dict):
@@ -39,11 +52,13 @@ def _load_toml(path: pathlib.Path) -> dict[str, Any]:
     return data
 
 
-def default_config_paths() -> list[pathlib.Path]:
+@functools.cache
+def default_config_paths() -> tuple[pathlib.Path, ...]:
     # Precedence (lower → higher): XDG config then legacy homefile
+    # Resolved once per process: the result only depends on $HOME/$XDG_CONFIG_HOME.
     xdg = pathlib.Path(user_config_dir("emailbison")) / "config.toml"
     legacy = pathlib.Path.home() / ".emailbison.toml"
-    return [xdg, legacy]
+    return (xdg, legacy)
 
 
 def load_settings(
@@ -84,14 +99,12 @@ def load_settings(
         "campaigns_path": os.getenv("EMAILBISON_CAMPAIGNS_PATH"),
     }
 
+    # Merge once (env over file), dropping unset/empty values so they fall through.
+    cfg = {k: v for k, v in file_cfg.items() if v not in (None, "")}
+    cfg.update((k, v) for k, v in env_cfg.items() if v not in (None, ""))
+
     def pick(key: str, explicit: Any) -> Any:
-        if explicit is not None:
-            return explicit
-        if env_cfg.get(key) not in (None, ""):
-            return env_cfg[key]
-        if key in file_cfg and file_cfg[key] not in (None, ""):
-            return file_cfg[key]
-        return None
+        return explicit if explicit is not None else cfg.get(key)
 
     final_base_url = pick("base_url", base_url) or "https://dedi.emailbison.com"
     final_api_token = pick("api_token", api_token)
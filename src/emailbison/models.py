@@ -8,6 +8,8 @@ from pydantic import BaseModel, ConfigDict, Field, model_validator
 class SenderEmailSelectSpec(BaseModel):
     """Selector for choosing sender email accounts from the workspace."""
 
+    model_config = ConfigDict(frozen=True)
+
     search: str | None = None
     tag_ids: list[int] | None = None
     excluded_tag_ids: list[int] | None = None
@@ -23,6 +25,8 @@ CampaignType = Literal["outbound", "reply_followup"]
 class CampaignSettings(BaseModel):
     """Maps to PATCH /api/campaigns/{id}/update"""
 
+    model_config = ConfigDict(frozen=True)
+
     name: str | None = None
     max_emails_per_day: int | None = None
     max_new_leads_per_day: int | None = None
@@ -37,9 +41,15 @@ class CampaignSettings(BaseModel):
     include_auto_replies_in_stats: bool | None = None
 
 
+# 24-hour HH:MM (00:00-23:59).
+_HH_MM = r"^(?:[01]\d|2[0-3]):[0-5]\d$"
+
+
 class CampaignSchedule(BaseModel):
     """Maps to POST/PUT /api/campaigns/{campaign_id}/schedule"""
 
+    model_config = ConfigDict(frozen=True)
+
     monday: bool = True
     tuesday: bool = True
     wednesday: bool = True
@@ -48,14 +58,16 @@ class CampaignSchedule(BaseModel):
     saturday: bool = False
     sunday: bool = False
 
-    start_time: str = Field(pattern=r"^\d{2}:\d{2}$")
-    end_time: str = Field(pattern=r"^\d{2}:\d{2}$")
+    start_time: str = Field(pattern=_HH_MM)
+    end_time: str = Field(pattern=_HH_MM)
     timezone: str
 
     save_as_template: bool = False
 
 
 class SequenceStep(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     email_subject: str = Field(min_length=1)
     email_subject_variables: list[str] | None = None
 
@@ -77,12 +89,14 @@ class SequenceStep(BaseModel):
 
 
 class SequenceSpec(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     title: str = Field(min_length=1)
     sequence_steps: list[SequenceStep] = Field(min_length=1)
 
 
 class SequenceStepUpdate(BaseModel):
-    model_config = ConfigDict(extra="ignore")
+    model_config = ConfigDict(frozen=True, extra="ignore")
 
     id: int = Field(ge=1)
 
@@ -106,13 +120,15 @@ class SequenceStepUpdate(BaseModel):
 
 
 class SequenceUpdateSpec(BaseModel):
-    model_config = ConfigDict(extra="ignore")
+    model_config = ConfigDict(frozen=True, extra="ignore")
 
     title: str = Field(min_length=1)
     sequence_steps: list[SequenceStepUpdate] = Field(min_length=1)
 
 
 class LeadsSpec(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     lead_list_id: int | None = None
     lead_ids: list[int] | None = None
     allow_parallel_sending: bool = False
@@ -138,7 +154,7 @@ class CampaignCreateSpec(BaseModel):
     File-driven mode should use this schema.
     """
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(frozen=True, extra="forbid")
 
     name: str = Field(min_length=1)
     type: CampaignType = "outbound"
@@ -165,6 +181,8 @@ class CampaignCreateSpec(BaseModel):
 
 
 class WorkflowStepResult(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     name: str
     ok: bool = True
 
@@ -175,6 +193,8 @@ class WorkflowStepResult(BaseModel):
 
 
 class CreateCampaignResult(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     id: int
     name: str
     status: str | None = None
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import json
+from collections.abc import Iterable
+from typing import Any, TextIO
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency (`pip install emailbison[fast]`)
+    orjson = None
+
+
+def _orjson_dumps(obj: Any, *, indent: bool) -> bytes | None:
+    if orjson is None:
+        return None
+    option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+    try:
+        return orjson.dumps(obj, option=option)
+    except TypeError:
+        # e.g. integers wider than 64 bits; the stdlib encoder handles those.
+        return None
+
+
+def loads(data: bytes) -> Any:
+    """Parse a JSON document from raw bytes, using orjson when it is installed.
+
+    Both parsers raise `json.JSONDecodeError` (orjson's error subclasses it).
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, *, indent: bool = True) -> bytes | str:
+    """Serialize `obj` for output, using orjson when it is installed.
+
+    orjson returns UTF-8 bytes; `typer.echo` writes those straight to the binary
+    stream, so callers can pass either result through unchanged.
+    """
+    encoded = _orjson_dumps(obj, indent=indent)
+    if encoded is not None:
+        return encoded
+    # ensure_ascii=False matches orjson, which writes non-ASCII text as raw UTF-8.
+    if indent:
+        return json.dumps(obj, indent=2, ensure_ascii=False)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
+
+def dump(obj: Any, stream: TextIO) -> None:
+    """Write `obj` as indented JSON plus a trailing newline to a text stream.
+
+    Without orjson the stdlib encoder writes chunk by chunk, so the serialized
+    document is never held in memory as one string.
+    """
+    encoded = _orjson_dumps(obj, indent=True)
+    if encoded is None:
+        json.dump(obj, stream, indent=2, ensure_ascii=False)
+        stream.write("\n")
+        return
+
+    binary = getattr(stream, "buffer", None)
+    if binary is None:
+        stream.write(encoded.decode())
+        stream.write("\n")
+        return
+    stream.flush()
+    binary.write(encoded)
+    binary.write(b"\n")
+    binary.flush()
+
+
+def dumps_lines(rows: Iterable[Any]) -> bytes | str:
+    """Serialize each row compactly and join them as JSON Lines (no trailing newline)."""
+    encoded = [dumps(row, indent=False) for row in rows]
+    if all(isinstance(chunk, bytes) for chunk in encoded):
+        return b"\n".join(encoded)
+    return "\n".join(c.decode() if isinstance(c, bytes) else c for c in encoded)
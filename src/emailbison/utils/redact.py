@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+_MASK8 = "*" * 8
+
 
 def redact_token(token: str, *, keep: int = 4) -> str:
     if not token:
         return ""
     if len(token) <= keep:
         return "*" * len(token)
-    return f"{token[:keep]}…{'*' * 8}"
+    return f"{token[:keep]}…{_MASK8}"
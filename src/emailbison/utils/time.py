@@ -18,8 +18,15 @@ def parse_datetime(value: str, *, default_tz: str | None = None) -> datetime:
     - Returns an aware datetime.
     """
     try:
-        dt = isoparse(value)
-    except (ValueError, TypeError) as e:
+        # The C parser covers the common ISO forms (including `Z`) on 3.11+;
+        # dateutil only handles whatever it rejects.
+        dt = datetime.fromisoformat(value)
+    except ValueError:
+        try:
+            dt = isoparse(value)
+        except (ValueError, TypeError) as e:
+            raise TimeParseError(f"Invalid datetime: {value!r}. Use ISO format.") from e
+    except TypeError as e:
         raise TimeParseError(f"Invalid datetime: {value!r}. Use ISO format.") from e
 
     if dt.tzinfo is None:
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+
+import httpx
+import pytest
+
+from emailbison.client import EmailBisonClient
+from emailbison.commands import campaign
+from emailbison.config import Settings
+
+# Built once for the whole suite; Settings is frozen, so sharing it is safe.
+SETTINGS = Settings(base_url="https://api.example.com", api_token="secret")
+
+
+@pytest.fixture(scope="session")
+def settings() -> Settings:
+    return SETTINGS
+
+
+@pytest.fixture(autouse=True)
+def _no_sleep(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Run the lead-list import poll on a virtual clock instead of real time.
+
+    Only the `_sleep`/`_monotonic` seams in `emailbison.commands.campaign` are replaced, not
+    the stdlib `time` module. Each fake sleep advances the fake clock, so a poll that never
+    sees a finished status reaches its timeout after a few iterations instead of spinning.
+    """
+    now = 0.0
+
+    def sleep(seconds: float) -> None:
+        nonlocal now
+        now += seconds
+
+    monkeypatch.setattr(campaign, "_sleep", sleep)
+    monkeypatch.setattr(campaign, "_monotonic", lambda: now)
+
+
+@pytest.fixture
+def cli_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Point CLI invocations at the same test settings the client fixtures use."""
+    monkeypatch.setenv("EMAILBISON_API_TOKEN", SETTINGS.api_token)
+    monkeypatch.setenv("EMAILBISON_BASE_URL", SETTINGS.base_url)
+
+
+@pytest.fixture(scope="session")
+def http_client() -> Iterator[httpx.Client]:
+    with httpx.Client() as c:
+        yield c
+
+
+@pytest.fixture
+def client(settings: Settings, http_client: httpx.Client) -> Iterator[EmailBisonClient]:
+    # The client itself is cheap to build; the connection pool underneath is shared for the
+    # whole session.
+    c = EmailBisonClient(settings, http_client=http_client)
+    yield c
+    c.close()
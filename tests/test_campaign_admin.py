@@ -0,0 +1,229 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+import respx
+from httpx import Response
+from typer.testing import CliRunner
+
+from emailbison.cli import app
+
+
+def test_summary_aggregates_stats_and_skips_failures(
+    respx_mock: respx.MockRouter, cli_env: None
+) -> None:
+    respx_mock.get("https://api.example.com/api/campaigns").mock(
+        return_value=Response(
+            200,
+            json={
+                "data": [
+                    {"id": 1, "name": "A", "status": "active"},
+                    {"id": 2, "name": "B", "status": "paused"},
+                    {"id": 3, "name": "C", "status": "active"},
+                ]
+            },
+        )
+    )
+    respx_mock.post("https://api.example.com/api/campaigns/1/stats").mock(
+        return_value=Response(200, json={"data": {"emails_sent": "10", "opened": 4}})
+    )
+    respx_mock.post("https://api.example.com/api/campaigns/2/stats").mock(
+        return_value=Response(500, json={"error": "boom"})
+    )
+    respx_mock.post("https://api.example.com/api/campaigns/3/stats").mock(
+        return_value=Response(200, json={"data": {"sent": 5, "emails_opened": 1.0}})
+    )
+
+    runner = CliRunner()
+    result = runner.invoke(
+        app,
+        ["--json", "campaign", "summary", "--start-date", "2024-07-01", "--end-date", "2024-07-19"],
+    )
+
+    assert result.exit_code == 0, result.output
+    payload = json.loads(result.stdout)
+    assert [row["campaign_id"] for row in payload["campaigns"]] == [1, 3]
+    assert payload["summary"]["sent"] == 15
+    assert payload["summary"]["opened"] == 5
+    assert payload["skipped_campaign_ids"] == [2]
+
+
+def test_summary_totals_only_omits_campaign_rows(
+    respx_mock: respx.MockRouter, cli_env: None
+) -> None:
+    respx_mock.get("https://api.example.com/api/campaigns").mock(
+        return_value=Response(
+            200,
+            json={"data": [{"id": 1, "name": "A"}, {"id": 2, "name": "B"}]},
+        )
+    )
+    respx_mock.post("https://api.example.com/api/campaigns/1/stats").mock(
+        return_value=Response(200, json={"data": {"sent": 3}})
+    )
+    respx_mock.post("https://api.example.com/api/campaigns/2/stats").mock(
+        return_value=Response(200, json={"data": {"sent": 4}})
+    )
+
+    runner = CliRunner()
+    args = ["campaign", "summary", "--start-date", "2024-07-01", "--end-date", "2024-07-19"]
+    result = runner.invoke(app, ["--json", *args, "--totals-only"])
+
+    assert result.exit_code == 0, result.output
+    payload = json.loads(result.stdout)
+    assert "campaigns" not in payload
+    assert payload["summary"]["sent"] == 7
+
+    result = runner.invoke(app, [*args, "--totals-only"])
+
+    assert result.exit_code == 0, result.output
+    lines = result.stdout.splitlines()
+    assert len(lines) == 3
+    assert lines[-1].startswith("TOTAL")
+
+
+def test_start_runs_preflight_then_resumes(respx_mock: respx.MockRouter, cli_env: None) -> None:
+    details = respx_mock.get("https://api.example.com/api/campaigns/7").mock(
+        side_effect=[
+            Response(200, json={"data": {"id": 7, "total_leads": 3, "status": "draft"}}),
+            Response(200, json={"data": {"id": 7, "total_leads": 3, "status": "active"}}),
+        ]
+    )
+    respx_mock.get("https://api.example.com/api/campaigns/7/sender-emails").mock(
+        return_value=Response(200, json={"data": [{"id": 1}]})
+    )
+    respx_mock.get("https://api.example.com/api/campaigns/v1.1/7/sequence-steps").mock(
+        return_value=Response(200, json={"data": {"sequence_steps": [{"id": 1}]}})
+    )
+    resume = respx_mock.patch("https://api.example.com/api/campaigns/7/resume").mock(
+        return_value=Response(200, json={"data": {"status": "queued"}})
+    )
+
+    runner = CliRunner()
+    result = runner.invoke(app, ["campaign", "start", "7"])
+
+    assert result.exit_code == 0, result.output
+    assert "id=7 started=true status=active" in result.output
+    assert resume.called
+    assert details.call_count == 2
+
+
+def test_api_error_exits_with_details(respx_mock: respx.MockRouter, cli_env: None) -> None:
+    respx_mock.get("https://api.example.com/api/campaigns/9").mock(
+        return_value=Response(404, json={"message": "not found"})
+    )
+
+    runner = CliRunner()
+    result = runner.invoke(app, ["campaign", "get", "9"])
+
+    assert result.exit_code == 3
+    assert '"message": "not found"' in result.stderr
+
+
+def test_pause_many_reports_each_outcome_and_fails_on_any_error(
+    respx_mock: respx.MockRouter, cli_env: None
+) -> None:
+    routes = {
+        cid: respx_mock.patch(f"https://api.example.com/api/campaigns/{cid}/pause").mock(
+            return_value=Response(200, json={"data": {"id": cid, "status": "paused"}})
+        )
+        for cid in (1, 3)
+    }
+    routes[2] = respx_mock.patch("https://api.example.com/api/campaigns/2/pause").mock(
+        return_value=Response(422, json={"message": "cannot pause"})
+    )
+
+    runner = CliRunner()
+    result = runner.invoke(app, ["campaign", "pause", "3", "2", "1", "2"])
+
+    assert result.exit_code == 3
+    assert result.stdout.splitlines() == [
+        "id=1 status=paused",
+        "id=2 error=API error (422).",
+        "id=3 status=paused",
+    ]
+    assert "Campaign 2: " in result.stderr and '"message": "cannot pause"' in result.stderr
+    assert all(route.call_count == 1 for route in routes.values())
+
+
+# (args, endpoint, full row, its rendered line, rendered line for a bare {"id": 2} row)
+LISTING_CASES = [
+    (
+        ["campaign", "list"],
+        "/api/campaigns",
+        {"id": 1, "status": "active", "name": "A"},
+        "id=1 status=active name=A",
+        "id=2 status=None name=None",
+    ),
+    (
+        ["campaign", "sender-emails", "5"],
+        "/api/campaigns/5/sender-emails",
+        {"id": 1, "status": "Connected", "email": "a@x.io"},
+        "id=1 status=Connected email=a@x.io",
+        "id=2 status=None email=None",
+    ),
+    (
+        ["campaign", "replies", "5"],
+        "/api/campaigns/5/replies",
+        {"id": 1, "from_email_address": "b@y.io", "subject": "Re: hi"},
+        "id=1 from=b@y.io subject=Re: hi",
+        "id=2 from=None subject=None",
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "args,path,row,full_line,bare_line", LISTING_CASES, ids=[c[0][1] for c in LISTING_CASES]
+)
+def test_listing_renders_rows_and_skips_non_objects(
+    respx_mock: respx.MockRouter,
+    cli_env: None,
+    args: list[str],
+    path: str,
+    row: dict,
+    full_line: str,
+    bare_line: str,
+) -> None:
+    respx_mock.get(f"https://api.example.com{path}").mock(
+        return_value=Response(200, json={"data": [row, "junk", {"id": 2}, 7]})
+    )
+
+    result = CliRunner().invoke(app, args)
+
+    assert result.exit_code == 0, result.output
+    assert result.stdout.splitlines() == [full_line, bare_line]
+
+
+NDJSON_CASES = [
+    (["campaign", "list"], "/api/campaigns"),
+    (["campaign", "sender-emails", "5"], "/api/campaigns/5/sender-emails"),
+    (["campaign", "replies", "5"], "/api/campaigns/5/replies"),
+]
+
+
+@pytest.mark.parametrize("args,path", NDJSON_CASES, ids=[c[0][1] for c in NDJSON_CASES])
+def test_ndjson_writes_one_compact_object_per_row(
+    respx_mock: respx.MockRouter, cli_env: None, args: list[str], path: str
+) -> None:
+    respx_mock.get(f"https://api.example.com{path}").mock(
+        side_effect=[
+            Response(200, json={"data": [{"id": 1, "name": "A"}, {"id": 2}]}),
+            Response(200, json={"data": []}),
+            Response(200, json={"message": "no rows here"}),
+        ]
+    )
+    runner = CliRunner()
+
+    # --ndjson wins over the global --json flag.
+    result = runner.invoke(app, ["--json", *args, "--ndjson"])
+    assert result.exit_code == 0, result.output
+    assert result.stdout.splitlines() == ['{"id":1,"name":"A"}', '{"id":2}']
+
+    result = runner.invoke(app, [*args, "--ndjson"])
+    assert result.exit_code == 0, result.output
+    assert result.stdout == ""
+
+    # Without a data list the whole response is kept, as one line.
+    result = runner.invoke(app, [*args, "--ndjson"])
+    assert result.exit_code == 0, result.output
+    assert result.stdout.splitlines() == ['{"message":"no rows here"}']
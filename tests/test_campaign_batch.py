@@ -2,19 +2,23 @@ from __future__ import annotations
 
 import json
 
+import pytest
 import respx
 from httpx import Response
 from typer.testing import CliRunner
 
 from emailbison.cli import app
+from emailbison.client import EmailBisonClient
+from emailbison.commands.campaign import (
+    LEAD_LIST_POLL_INTERVAL_SECONDS,
+    LEAD_LIST_POLL_TIMEOUT_SECONDS,
+    WorkflowValidationError,
+    _wait_for_lead_list_processing,
+)
 
 
-@respx.mock
-def test_create_batch_happy_path(tmp_path, monkeypatch) -> None:
-    monkeypatch.setenv("EMAILBISON_API_TOKEN", "secret")
-    monkeypatch.setenv("EMAILBISON_BASE_URL", "https://api.example.com")
-    monkeypatch.setattr("emailbison.commands.campaign.time.sleep", lambda _: None)
-
+@pytest.mark.slow
+def test_create_batch_happy_path(respx_mock: respx.MockRouter, tmp_path, cli_env: None) -> None:
     csv_dir = tmp_path / "districts"
     csv_dir.mkdir()
     (csv_dir / "district_a.csv").write_text(
@@ -59,31 +63,31 @@ def test_create_batch_happy_path(tmp_path, monkeypatch) -> None:
         encoding="utf-8",
     )
 
-    respx.post("https://api.example.com/api/leads/bulk/csv").mock(
+    respx_mock.post("https://api.example.com/api/leads/bulk/csv").mock(
         return_value=Response(200, json={"data": {"id": 501, "status": "Unprocessed"}})
     )
-    respx.get("https://api.example.com/api/leads/lists/501").mock(
+    respx_mock.get("https://api.example.com/api/leads/lists/501").mock(
         side_effect=[
             Response(200, json={"data": {"id": 501, "status": "Processing"}}),
             Response(200, json={"data": {"id": 501, "status": "Processed"}}),
         ]
     )
-    respx.post("https://api.example.com/api/campaigns").mock(
+    respx_mock.post("https://api.example.com/api/campaigns").mock(
         return_value=Response(200, json={"data": {"id": 900, "status": "draft"}})
     )
-    respx.patch("https://api.example.com/api/campaigns/900/update").mock(
+    respx_mock.patch("https://api.example.com/api/campaigns/900/update").mock(
         return_value=Response(200, json={"data": {"id": 900}})
     )
-    respx.post("https://api.example.com/api/campaigns/900/schedule").mock(
+    respx_mock.post("https://api.example.com/api/campaigns/900/schedule").mock(
         return_value=Response(200, json={"data": {"id": 900}})
     )
-    respx.post("https://api.example.com/api/campaigns/v1.1/900/sequence-steps").mock(
+    respx_mock.post("https://api.example.com/api/campaigns/v1.1/900/sequence-steps").mock(
         return_value=Response(200, json={"data": {"id": 33}})
     )
-    respx.post("https://api.example.com/api/campaigns/900/attach-sender-emails").mock(
+    respx_mock.post("https://api.example.com/api/campaigns/900/attach-sender-emails").mock(
         return_value=Response(200, json={"success": True})
     )
-    respx.post("https://api.example.com/api/campaigns/900/leads/attach-lead-list").mock(
+    respx_mock.post("https://api.example.com/api/campaigns/900/leads/attach-lead-list").mock(
         return_value=Response(200, json={"success": True})
     )
 
@@ -110,12 +114,9 @@ def test_create_batch_happy_path(tmp_path, monkeypatch) -> None:
     assert "summary: total_processed=1 succeeded=1 failed=0 leads_loaded=2" in result.output
 
 
-@respx.mock
-def test_create_batch_skip_and_continue_on_failure(tmp_path, monkeypatch) -> None:
-    monkeypatch.setenv("EMAILBISON_API_TOKEN", "secret")
-    monkeypatch.setenv("EMAILBISON_BASE_URL", "https://api.example.com")
-    monkeypatch.setattr("emailbison.commands.campaign.time.sleep", lambda _: None)
-
+def test_create_batch_skip_and_continue_on_failure(
+    respx_mock: respx.MockRouter, tmp_path, cli_env: None
+) -> None:
     csv_dir = tmp_path / "districts"
     csv_dir.mkdir()
     (csv_dir / "district_a.csv").write_text(
@@ -127,20 +128,20 @@ def test_create_batch_skip_and_continue_on_failure(tmp_path, monkeypatch) -> Non
         encoding="utf-8",
     )
 
-    respx.post("https://api.example.com/api/leads/bulk/csv").mock(
+    respx_mock.post("https://api.example.com/api/leads/bulk/csv").mock(
         side_effect=[
             Response(200, json={"data": {"id": 601, "status": "Processed"}}),
             Response(200, json={"data": {"id": 602, "status": "Processed"}}),
         ]
     )
-    respx.post("https://api.example.com/api/campaigns/901/attach-sender-emails").mock(
+    respx_mock.post("https://api.example.com/api/campaigns/901/attach-sender-emails").mock(
         return_value=Response(200, json={"success": True})
     )
-    respx.post("https://api.example.com/api/campaigns/901/leads/attach-lead-list").mock(
+    respx_mock.post("https://api.example.com/api/campaigns/901/leads/attach-lead-list").mock(
         return_value=Response(200, json={"success": True})
     )
     # Second file fails while creating campaign.
-    respx.post("https://api.example.com/api/campaigns").mock(
+    respx_mock.post("https://api.example.com/api/campaigns").mock(
         side_effect=[
             Response(200, json={"data": {"id": 901, "status": "draft"}}),
             Response(500, json={"error": "boom"}),
@@ -162,3 +163,17 @@ def test_create_batch_skip_and_continue_on_failure(tmp_path, monkeypatch) -> Non
 
     assert result.exit_code == 0, result.output
     assert "summary: total_processed=2 succeeded=1 failed=1 leads_loaded=1" in result.output
+
+
+def test_lead_list_poll_times_out_on_the_poll_clock(
+    respx_mock: respx.MockRouter, client: EmailBisonClient
+) -> None:
+    route = respx_mock.get("https://api.example.com/api/leads/lists/9").mock(
+        return_value=Response(200, json={"data": {"id": 9, "status": "Processing"}})
+    )
+
+    with pytest.raises(WorkflowValidationError, match="Timed out"):
+        _wait_for_lead_list_processing(client=client, lead_list_id=9, initial_status="pending")
+
+    polls = LEAD_LIST_POLL_TIMEOUT_SECONDS // LEAD_LIST_POLL_INTERVAL_SECONDS + 1
+    assert route.call_count == polls
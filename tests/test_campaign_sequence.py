@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import json
+
+import respx
+from httpx import Response
+from typer.testing import CliRunner
+
+from emailbison.cli import app
+
+
+def test_sequence_set_posts_validated_file(
+    respx_mock: respx.MockRouter, tmp_path, cli_env: None
+) -> None:
+    spec_file = tmp_path / "sequence.json"
+    spec_file.write_text(
+        json.dumps(
+            {
+                "title": "Seq",
+                "sequence_steps": [
+                    {"email_subject": "Hi", "email_body": "Body", "wait_in_days": 1},
+                ],
+            }
+        ),
+        encoding="utf-8",
+    )
+    route = respx_mock.post("https://api.example.com/api/campaigns/v1.1/5/sequence-steps").mock(
+        return_value=Response(200, json={"data": {"id": 1}})
+    )
+
+    runner = CliRunner()
+    result = runner.invoke(app, ["campaign", "sequence", "set", "5", "--file", str(spec_file)])
+
+    assert result.exit_code == 0, result.output
+    assert json.loads(route.calls.last.request.content) == {
+        "title": "Seq",
+        "sequence_steps": [{"email_subject": "Hi", "email_body": "Body", "wait_in_days": 1}],
+    }
+
+
+def test_sequence_set_rejects_invalid_file(monkeypatch, tmp_path) -> None:
+    monkeypatch.setenv("EMAILBISON_API_TOKEN", "secret")
+
+    spec_file = tmp_path / "sequence.json"
+    spec_file.write_text("[1, 2", encoding="utf-8")
+
+    runner = CliRunner()
+    result = runner.invoke(app, ["campaign", "sequence", "set", "5", "--file", str(spec_file)])
+
+    assert result.exit_code == 2
+    assert "Validation error" in result.stderr
+
+
+def test_sequence_get_renders_one_line_per_step(
+    respx_mock: respx.MockRouter, cli_env: None
+) -> None:
+    respx_mock.get("https://api.example.com/api/campaigns/v1.1/5/sequence-steps").mock(
+        return_value=Response(
+            200,
+            json={
+                "data": {
+                    "sequence_id": 9,
+                    "sequence_steps": [
+                        {"id": 1, "order": 1, "wait_in_days": 1, "email_subject": "Hi"},
+                        "junk",
+                        {"id": 2, "order": 2, "email_subject": "Again"},
+                    ],
+                }
+            },
+        )
+    )
+
+    runner = CliRunner()
+    result = runner.invoke(app, ["campaign", "sequence", "get", "5"])
+
+    assert result.exit_code == 0, result.output
+    assert result.stdout.splitlines() == [
+        "sequence_id=9",
+        "step_id=1 order=1 wait_in_days=1 subject=Hi",
+        "step_id=2 order=2 wait_in_days=None subject=Again",
+    ]
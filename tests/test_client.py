@@ -1,7 +1,11 @@
 from __future__ import annotations
 
 import json
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from typing import Any
 
+import httpx
 import pytest
 import respx
 from httpx import Response
@@ -9,141 +13,212 @@ from httpx import Response
 from emailbison.client import ApiError, AuthError, EmailBisonClient
 from emailbison.config import Settings
 
+MockClient = Callable[..., tuple[EmailBisonClient, list[httpx.Request]]]
 
-def _settings() -> Settings:
-    return Settings(base_url="https://api.example.com", api_token="secret")
 
+@pytest.fixture
+def mock_client(settings: Settings) -> Iterator[MockClient]:
+    """Build clients over an httpx.MockTransport that answers every request with one response.
 
-@respx.mock
-def test_auth_error() -> None:
-    respx.post("https://api.example.com/api/campaigns").mock(
-        return_value=Response(401, json={"error": "no"})
-    )
+    For single-endpoint tests this skips respx's route matching and global patching; each
+    factory call also returns the list of requests the transport saw, for URL/method checks.
+    """
+    transports: list[httpx.Client] = []
+
+    def factory(
+        status: int, json_body: Any, headers: dict[str, str] | None = None
+    ) -> tuple[EmailBisonClient, list[httpx.Request]]:
+        seen: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> Response:
+            seen.append(request)
+            return Response(status, json=json_body, headers=headers or {})
+
+        http_client = httpx.Client(transport=httpx.MockTransport(handler))
+        transports.append(http_client)
+        return EmailBisonClient(settings, http_client=http_client), seen
+
+    yield factory
+    for http_client in transports:
+        http_client.close()
+
+
+def test_auth_error(mock_client: MockClient) -> None:
+    client, seen = mock_client(401, {"error": "no"})
 
-    client = EmailBisonClient(_settings())
     with pytest.raises(AuthError):
         client.create_campaign(name="x")
-    client.close()
+    assert (seen[0].method, str(seen[0].url)) == ("POST", "https://api.example.com/api/campaigns")
 
 
-@respx.mock
-def test_rate_limit_error() -> None:
-    respx.post("https://api.example.com/api/campaigns").mock(
-        return_value=Response(429, headers={"retry-after": "10"}, json={"error": "rl"})
-    )
+def test_rate_limit_error(mock_client: MockClient) -> None:
+    client, seen = mock_client(429, {"error": "rl"}, headers={"retry-after": "10"})
 
-    client = EmailBisonClient(_settings())
     with pytest.raises(ApiError):
         client.create_campaign(name="x")
-    client.close()
+    assert len(seen) == 1
 
 
-@respx.mock
-def test_list_campaigns() -> None:
-    respx.get("https://api.example.com/api/campaigns").mock(
-        return_value=Response(200, json={"data": []})
-    )
+def test_list_campaigns(mock_client: MockClient) -> None:
+    client, seen = mock_client(200, {"data": []})
 
-    client = EmailBisonClient(_settings())
     raw, _ = client.list_campaigns()
     assert raw["data"] == []
-    client.close()
-
-
-@respx.mock
-def test_campaign_details_pause_resume_archive() -> None:
-    respx.get("https://api.example.com/api/campaigns/123").mock(
-        return_value=Response(200, json={"data": {"id": 123, "status": "draft"}})
-    )
-    respx.patch("https://api.example.com/api/campaigns/123/pause").mock(
-        return_value=Response(200, json={"data": {"id": 123, "status": "paused"}})
-    )
-    respx.patch("https://api.example.com/api/campaigns/123/resume").mock(
-        return_value=Response(200, json={"data": {"id": 123, "status": "queued"}})
-    )
-    respx.patch("https://api.example.com/api/campaigns/123/archive").mock(
-        return_value=Response(200, json={"data": {"id": 123, "status": "archived"}})
+    assert seen[0].url.path == "/api/campaigns"
+
+
+LIFECYCLE_CASES = [
+    ("campaign_details", "get", "", "draft"),
+    ("pause_campaign", "patch", "/pause", "paused"),
+    ("resume_campaign", "patch", "/resume", "queued"),
+    ("archive_campaign", "patch", "/archive", "archived"),
+]
+
+
+@pytest.mark.parametrize(
+    "method,verb,suffix,expected", LIFECYCLE_CASES, ids=[c[0] for c in LIFECYCLE_CASES]
+)
+def test_campaign_details_pause_resume_archive(
+    respx_mock: respx.MockRouter,
+    client: EmailBisonClient,
+    method: str,
+    verb: str,
+    suffix: str,
+    expected: str,
+) -> None:
+    route = getattr(respx_mock, verb)(f"https://api.example.com/api/campaigns/123{suffix}").mock(
+        return_value=Response(200, json={"data": {"id": 123, "status": expected}})
     )
 
-    client = EmailBisonClient(_settings())
-    raw, _ = client.campaign_details(123)
-    assert raw["data"]["id"] == 123
-
-    raw, _ = client.pause_campaign(123)
-    assert raw["data"]["status"] == "paused"
-
-    raw, _ = client.resume_campaign(123)
-    assert raw["data"]["status"] == "queued"
-
-    raw, _ = client.archive_campaign(123)
-    assert raw["data"]["status"] == "archived"
+    raw, _ = getattr(client, method)(123)
+    assert raw["data"] == {"id": 123, "status": expected}
+    assert route.called
 
-    client.close()
 
+def test_pause_resume_archive_many_campaigns(
+    respx_mock: respx.MockRouter, client: EmailBisonClient
+) -> None:
+    for cid in (1, 2, 3):
+        respx_mock.patch(f"https://api.example.com/api/campaigns/{cid}/pause").mock(
+            return_value=Response(200, json={"data": {"id": cid, "status": "paused"}})
+        )
 
-@respx.mock
-def test_campaign_sender_emails_attach_remove() -> None:
-    respx.get("https://api.example.com/api/campaigns/123/sender-emails").mock(
-        return_value=Response(200, json={"data": [{"id": 1, "email": "a@b.com"}]})
-    )
-    respx.post("https://api.example.com/api/campaigns/123/attach-sender-emails").mock(
-        return_value=Response(200, json={"success": True})
-    )
-    respx.delete("https://api.example.com/api/campaigns/123/remove-sender-emails").mock(
-        return_value=Response(200, json={"success": True})
+    respx_mock.patch("https://api.example.com/api/campaigns/4/pause").mock(
+        return_value=Response(422, json={"message": "archived"})
     )
 
-    client = EmailBisonClient(_settings())
-
-    raw, _ = client.get_campaign_sender_emails(123)
-    assert raw["data"][0]["id"] == 1
-
-    raw, _ = client.attach_sender_emails(123, sender_email_ids=[1, 2])
-    assert raw["success"] is True
+    results = client.pause_campaigns([1, 2, 4, 3, 2])
+    assert list(results) == [1, 2, 4, 3]
+    assert all(results[cid]["data"]["status"] == "paused" for cid in (1, 2, 3))
+    assert isinstance(results[4], ApiError) and results[4].status_code == 422
+
+
+@pytest.mark.parametrize(
+    "verb,path,call,body",
+    [
+        (
+            "get",
+            "sender-emails",
+            lambda c: c.get_campaign_sender_emails(123),
+            {"data": [{"id": 1, "email": "a@b.com"}]},
+        ),
+        (
+            "post",
+            "attach-sender-emails",
+            lambda c: c.attach_sender_emails(123, sender_email_ids=[1, 2]),
+            {"success": True},
+        ),
+        (
+            "delete",
+            "remove-sender-emails",
+            lambda c: c.remove_sender_emails(123, sender_email_ids=[1]),
+            {"success": True},
+        ),
+    ],
+    ids=["list", "attach", "remove"],
+)
+def test_campaign_sender_emails_attach_remove(
+    respx_mock: respx.MockRouter,
+    client: EmailBisonClient,
+    verb: str,
+    path: str,
+    call: Callable[[EmailBisonClient], tuple[dict[str, Any], Any]],
+    body: dict[str, Any],
+) -> None:
+    getattr(respx_mock, verb)(f"https://api.example.com/api/campaigns/123/{path}").mock(
+        return_value=Response(200, json=body)
+    )
 
-    raw, _ = client.remove_sender_emails(123, sender_email_ids=[1])
-    assert raw["success"] is True
+    raw, _ = call(client)
+    assert raw == body
+
+
+@pytest.mark.parametrize(
+    "verb,path,call,body",
+    [
+        (
+            "post",
+            "stats",
+            lambda c: c.campaign_stats(123, start_date="2024-07-01", end_date="2024-07-19"),
+            {"data": {"emails_sent": "1"}},
+        ),
+        (
+            "get",
+            "replies",
+            lambda c: c.campaign_replies(123, search="x"),
+            {"data": [{"id": 9, "subject": "hi"}]},
+        ),
+        (
+            "post",
+            "leads/stop-future-emails",
+            lambda c: c.stop_future_emails_for_leads(123, lead_ids=[1, 2, 3]),
+            {"data": {"success": True}},
+        ),
+    ],
+    ids=["stats", "replies", "stop-future-emails"],
+)
+def test_campaign_stats_replies_stop_future_emails(
+    respx_mock: respx.MockRouter,
+    client: EmailBisonClient,
+    verb: str,
+    path: str,
+    call: Callable[[EmailBisonClient], tuple[dict[str, Any], Any]],
+    body: dict[str, Any],
+) -> None:
+    getattr(respx_mock, verb)(f"https://api.example.com/api/campaigns/123/{path}").mock(
+        return_value=Response(200, json=body)
+    )
 
-    client.close()
+    raw, _ = call(client)
+    assert raw == body
 
 
-@respx.mock
-def test_campaign_stats_replies_stop_future_emails() -> None:
-    respx.post("https://api.example.com/api/campaigns/123/stats").mock(
-        return_value=Response(200, json={"data": {"emails_sent": "1"}})
-    )
-    respx.get("https://api.example.com/api/campaigns/123/replies").mock(
-        return_value=Response(200, json={"data": [{"id": 9, "subject": "hi"}]})
+def test_campaign_stats_bulk_returns_errors_per_campaign(
+    respx_mock: respx.MockRouter, client: EmailBisonClient
+) -> None:
+    respx_mock.post("https://api.example.com/api/campaigns/1/stats").mock(
+        return_value=Response(200, json={"data": {"emails_sent": 3}})
     )
-    respx.post("https://api.example.com/api/campaigns/123/leads/stop-future-emails").mock(
-        return_value=Response(200, json={"data": {"success": True}})
+    respx_mock.post("https://api.example.com/api/campaigns/2/stats").mock(
+        return_value=Response(500, json={"error": "boom"})
     )
 
-    client = EmailBisonClient(_settings())
+    stats = client.campaign_stats_bulk([1, 2, 1], start_date="2024-07-01", end_date="2024-07-19")
+    assert list(stats) == [1, 2]
+    assert stats[1]["data"]["emails_sent"] == 3
+    assert isinstance(stats[2], ApiError)
 
-    raw, _ = client.campaign_stats(123, start_date="2024-07-01", end_date="2024-07-19")
-    assert raw["data"]["emails_sent"] == "1"
-
-    raw, _ = client.campaign_replies(123, search="x")
-    assert raw["data"][0]["id"] == 9
-
-    raw, _ = client.stop_future_emails_for_leads(123, lead_ids=[1, 2, 3])
-    assert raw["data"]["success"] is True
-
-    client.close()
 
-
-@respx.mock
-def test_list_campaigns_filters_and_stats_payload() -> None:
-    list_route = respx.get("https://api.example.com/api/campaigns").mock(
+def test_list_campaigns_filters_and_stats_payload(
+    respx_mock: respx.MockRouter, client: EmailBisonClient
+) -> None:
+    list_route = respx_mock.get("https://api.example.com/api/campaigns").mock(
         return_value=Response(200, json={"data": [{"id": 1, "name": "A"}]})
     )
-    stats_route = respx.post("https://api.example.com/api/campaigns/1/stats").mock(
+    stats_route = respx_mock.post("https://api.example.com/api/campaigns/1/stats").mock(
         return_value=Response(200, json={"data": {"emails_sent": "1"}})
     )
 
-    client = EmailBisonClient(_settings())
-
     raw, _ = client.list_campaigns(status="active", tag_ids=[10, 20])
     assert raw["data"][0]["id"] == 1
     assert list_route.called
@@ -157,44 +232,56 @@ def test_list_campaigns_filters_and_stats_payload() -> None:
     stats_payload = json.loads(stats_route.calls[0].request.content.decode())
     assert stats_payload == {"start_date": "2024-07-01", "end_date": "2024-07-19"}
 
-    client.close()
-
 
-@respx.mock
-def test_list_sender_emails() -> None:
-    respx.get("https://api.example.com/api/sender-emails").mock(
-        return_value=Response(200, json={"data": [{"id": 7, "email": "x@y.com"}]})
-    )
+def test_list_sender_emails(mock_client: MockClient) -> None:
+    client, seen = mock_client(200, {"data": [{"id": 7, "email": "x@y.com"}]})
 
-    client = EmailBisonClient(_settings())
     raw, _ = client.list_sender_emails(search="x")
     assert raw["data"][0]["id"] == 7
-    client.close()
-
-
-@respx.mock
-def test_sequence_get_set_update() -> None:
-    respx.get("https://api.example.com/api/campaigns/v1.1/123/sequence-steps").mock(
-        return_value=Response(
-            200,
-            json={
-                "data": {
-                    "sequence_id": 55,
-                    "sequence_steps": [{"id": 9, "email_subject": "Hi", "order": 1}],
-                }
-            },
+    assert seen[0].url.path == "/api/sender-emails"
+
+
+# name -> (method, path, status, JSON body). Responses are built fresh on install, since an
+# httpx.Response is consumed by the request that receives it.
+ROUTES: dict[str, tuple[str, str, int, Any]] = {
+    "sequence.get": (
+        "GET",
+        "/api/campaigns/v1.1/123/sequence-steps",
+        200,
+        {"data": {"sequence_id": 55, "sequence_steps": [{"id": 9, "email_subject": "Hi"}]}},
+    ),
+    "sequence.create": (
+        "POST",
+        "/api/campaigns/v1.1/123/sequence-steps",
+        200,
+        {"data": {"id": 55}},
+    ),
+    "sequence.update": ("PUT", "/api/campaigns/v1.1/sequence-steps/55", 200, {"data": {"id": 55}}),
+    "lead_list.legacy_404": ("GET", "/api/leads/lists/77", 404, {"error": "not found"}),
+    "lead_list.get": (
+        "GET",
+        "/api/lead-lists/77",
+        200,
+        {"data": {"id": 77, "status": "Processed"}},
+    ),
+}
+
+
+def install(respx_mock: respx.MockRouter, *names: str) -> list[respx.Route]:
+    routes = []
+    for name in names:
+        method, path, status, body = ROUTES[name]
+        routes.append(
+            respx_mock.route(method=method, url=f"https://api.example.com{path}").mock(
+                return_value=Response(status, json=body)
+            )
         )
-    )
+    return routes
 
-    respx.post("https://api.example.com/api/campaigns/v1.1/123/sequence-steps").mock(
-        return_value=Response(200, json={"data": {"id": 55}})
-    )
 
-    respx.put("https://api.example.com/api/campaigns/v1.1/sequence-steps/55").mock(
-        return_value=Response(200, json={"data": {"id": 55}})
-    )
-
-    client = EmailBisonClient(_settings())
+@pytest.mark.slow
+def test_sequence_get_set_update(respx_mock: respx.MockRouter, client: EmailBisonClient) -> None:
+    install(respx_mock, "sequence.get", "sequence.create", "sequence.update")
 
     raw, _ = client.get_sequence_steps_v11(123)
     assert raw["data"]["sequence_id"] == 55
@@ -205,40 +292,62 @@ def test_sequence_get_set_update() -> None:
     raw, _ = client.update_sequence_steps_v11(55, {"title": "x", "sequence_steps": []})
     assert raw["data"]["id"] == 55
 
-    client.close()
 
+@pytest.fixture(scope="module")
+def leads_csv(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    path = tmp_path_factory.mktemp("leads") / "district.csv"
+    path.write_text("first_name,last_name,email\nA,B,a@example.com\n", encoding="utf-8")
+    return path
+
+
+_COLUMNS = {"first_name": "first_name", "last_name": "last_name", "email": "email"}
 
-@respx.mock
-def test_upload_leads_csv(tmp_path) -> None:
-    csv_path = tmp_path / "district.csv"
-    csv_path.write_text("first_name,last_name,email\nA,B,a@example.com\n", encoding="utf-8")
 
-    route = respx.post("https://api.example.com/api/leads/bulk/csv").mock(
+def test_upload_leads_csv_response(
+    respx_mock: respx.MockRouter, client: EmailBisonClient, leads_csv: Path
+) -> None:
+    respx_mock.post("https://api.example.com/api/leads/bulk/csv").mock(
         return_value=Response(200, json={"data": {"id": 321, "status": "Unprocessed"}})
     )
 
-    client = EmailBisonClient(_settings())
-    raw, _ = client.upload_leads_csv(
-        name="District A",
-        csv_path=csv_path,
-        columns_to_map={"first_name": "first_name", "last_name": "last_name", "email": "email"},
-    )
+    raw, _ = client.upload_leads_csv(name="District A", csv_path=leads_csv, columns_to_map=_COLUMNS)
     assert raw["data"]["id"] == 321
+
+
+@pytest.mark.slow
+def test_upload_leads_csv_multipart_headers(
+    respx_mock: respx.MockRouter, client: EmailBisonClient, leads_csv: Path
+) -> None:
+    route = respx_mock.post("https://api.example.com/api/leads/bulk/csv").mock(
+        return_value=Response(200, json={"data": {"id": 321, "status": "Unprocessed"}})
+    )
+
+    client.upload_leads_csv(name="District A", csv_path=leads_csv, columns_to_map=_COLUMNS)
     assert route.called
     assert "multipart/form-data" in route.calls[0].request.headers.get("content-type", "")
-    client.close()
 
 
-@respx.mock
-def test_get_lead_list_fallback_endpoint() -> None:
-    respx.get("https://api.example.com/api/leads/lists/77").mock(
-        return_value=Response(404, json={"error": "not found"})
-    )
-    respx.get("https://api.example.com/api/lead-lists/77").mock(
-        return_value=Response(200, json={"data": {"id": 77, "status": "Processed"}})
-    )
+def test_get_lead_list_fallback_endpoint(
+    respx_mock: respx.MockRouter, client: EmailBisonClient
+) -> None:
+    legacy, current = install(respx_mock, "lead_list.legacy_404", "lead_list.get")
 
-    client = EmailBisonClient(_settings())
     raw, _ = client.get_lead_list(77)
     assert raw["data"]["id"] == 77
-    client.close()
+    assert legacy.called and current.called
+
+
+def test_shared_http_client_gets_settings_per_request_and_stays_open(
+    respx_mock: respx.MockRouter, settings: Settings
+) -> None:
+    route = respx_mock.get("https://api.example.com/api/campaigns").mock(
+        return_value=Response(200, json={"data": []})
+    )
+
+    with httpx.Client() as shared:
+        client = EmailBisonClient(settings, http_client=shared)
+        client.list_campaigns()
+        client.close()
+        assert not shared.is_closed
+
+    assert route.calls.last.request.headers["authorization"] == "Bearer secret"
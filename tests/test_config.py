@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import os
+
+from emailbison import config
+
+
+def test_load_toml_reparses_only_when_file_changes(tmp_path) -> None:
+    path = tmp_path / "config.toml"
+    assert config._load_toml(path) == {}
+
+    path.write_text('api_token = "one"\n', encoding="utf-8")
+    os.utime(path, ns=(1_000_000_000, 1_000_000_000))
+    first = config._load_toml(path)
+    assert first == {"api_token": "one"}
+    assert config._load_toml(path) is first
+
+    path.write_text('api_token = "two"\n', encoding="utf-8")
+    os.utime(path, ns=(2_000_000_000, 2_000_000_000))
+    assert config._load_toml(path) == {"api_token": "two"}
+
+
+def test_load_settings_precedence(monkeypatch, tmp_path) -> None:
+    path = tmp_path / "config.toml"
+    path.write_text(
+        'api_token = "file-token"\nbase_url = "https://file.example.com/"\nretries = 5\n',
+        encoding="utf-8",
+    )
+    monkeypatch.setattr(config, "default_config_paths", lambda: (path,))
+    monkeypatch.setenv("EMAILBISON_API_TOKEN", "")
+    monkeypatch.setenv("EMAILBISON_RETRIES", "7")
+    monkeypatch.delenv("EMAILBISON_BASE_URL", raising=False)
+
+    settings = config.load_settings(retries=9)
+    assert settings.api_token == "file-token"
+    assert settings.base_url == "https://file.example.com"
+    assert settings.retries == 9
+
+    assert config.load_settings().retries == 7
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import io
+import json
+
+import pytest
+
+from emailbison.utils import jsonio
+
+
+def _dump_bytes(payload: object) -> bytes:
+    stream = io.TextIOWrapper(io.BytesIO(), encoding="utf-8")
+    jsonio.dump(payload, stream)
+    stream.flush()
+    return stream.buffer.getvalue()
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        {"data": [{"id": 1, "name": "Zoë", "tags": [], "meta": {"ok": True}}]},
+        # Wider than 64 bits: orjson refuses it and the stdlib encoder takes over.
+        {"data": [{"id": 1, "name": "Zoë"}], "total": 10**30},
+    ],
+    ids=["orjson-native", "wide-int"],
+)
+def test_dump_round_trips(monkeypatch, payload: dict) -> None:
+    # Output must not depend on whether the optional `fast` extra is installed.
+    outputs = []
+    if jsonio.orjson is not None:
+        outputs.append(_dump_bytes(payload))
+    monkeypatch.setattr(jsonio, "orjson", None)
+    outputs.append(_dump_bytes(payload))
+
+    for out in outputs:
+        text = out.decode("utf-8")
+        assert text.endswith("}\n")
+        assert "Zoë" in text
+        assert json.loads(text) == payload
+    assert len(set(outputs)) == 1
+
+
+def test_compact_output_matches_without_orjson(monkeypatch) -> None:
+    if jsonio.orjson is None:
+        pytest.skip("orjson not installed")
+
+    rows = [{"id": 1, "name": "Zoë"}]
+    fast = (jsonio.dumps(rows[0]), jsonio.dumps_lines(rows))
+    monkeypatch.setattr(jsonio, "orjson", None)
+    slow = (jsonio.dumps(rows[0]), jsonio.dumps_lines(rows))
+
+    assert fast == tuple(out.encode() for out in slow)
+
+
+def test_dumps_lines_is_one_compact_document_per_row() -> None:
+    out = jsonio.dumps_lines([{"id": 1}, {"id": 2}])
+    if isinstance(out, bytes):
+        out = out.decode()
+    assert out.splitlines() == ['{"id":1}', '{"id":2}']
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_loads_raises_stdlib_decode_error(monkeypatch, use_orjson: bool) -> None:
+    if not use_orjson:
+        monkeypatch.setattr(jsonio, "orjson", None)
+    elif jsonio.orjson is None:
+        pytest.skip("orjson not installed")
+
+    assert jsonio.loads('{"name": "Zoë"}'.encode()) == {"name": "Zoë"}
+    with pytest.raises(json.JSONDecodeError):
+        jsonio.loads(b"{")
@@ -1,44 +1,59 @@
 from __future__ import annotations
 
-import pytest
-from pydantic import ValidationError
-
-from emailbison.models import CampaignCreateSpec, LeadsSpec, SequenceSpec
-
-
-def test_leads_exclusive() -> None:
-    with pytest.raises(ValidationError):
-        LeadsSpec(lead_list_id=1, lead_ids=[1, 2])
-
-
-def test_campaign_create_requires_name() -> None:
-    with pytest.raises(ValidationError):
-        CampaignCreateSpec.model_validate({})
-
-
-def test_sequence_requires_steps() -> None:
-    with pytest.raises(ValidationError):
-        SequenceSpec.model_validate({"title": "x", "sequence_steps": []})
+from typing import Any
 
-
-def test_sender_email_ids_non_empty_if_present() -> None:
+import pytest
+from pydantic import BaseModel, ValidationError
+
+from emailbison.models import CampaignCreateSpec, CampaignSchedule, LeadsSpec, SequenceSpec
+
+_SCHEDULE = {"start_time": "00:00", "end_time": "23:59", "timezone": "UTC"}
+
+
+@pytest.mark.parametrize(
+    "model,data",
+    [
+        pytest.param(LeadsSpec, {"lead_list_id": 1, "lead_ids": [1, 2]}, id="leads-exclusive"),
+        pytest.param(CampaignCreateSpec, {}, id="campaign-requires-name"),
+        pytest.param(
+            SequenceSpec, {"title": "x", "sequence_steps": []}, id="sequence-requires-steps"
+        ),
+        pytest.param(
+            CampaignCreateSpec,
+            {"name": "x", "sender_email_ids": []},
+            id="sender-email-ids-non-empty",
+        ),
+        pytest.param(
+            CampaignCreateSpec,
+            {"name": "x", "sender_email_ids": [1], "sender_emails": {"search": "x", "limit": 1}},
+            id="sender-email-selector-exclusive",
+        ),
+        pytest.param(
+            CampaignCreateSpec,
+            {"name": "x", "sender_emails": {"search": "x", "limit": 0}},
+            id="sender-email-selector-limit-ge-1",
+        ),
+        *(
+            pytest.param(CampaignSchedule, {**_SCHEDULE, "end_time": bad}, id=f"schedule-{bad}")
+            for bad in ("24:00", "09:60", "99:99", "9:00")
+        ),
+    ],
+)
+def test_model_validation_errors(model: type[BaseModel], data: dict[str, Any]) -> None:
     with pytest.raises(ValidationError):
-        CampaignCreateSpec.model_validate({"name": "x", "sender_email_ids": []})
+        model.model_validate(data)
 
 
-def test_sender_email_selector_exclusive() -> None:
-    with pytest.raises(ValidationError):
-        CampaignCreateSpec.model_validate(
-            {
-                "name": "x",
-                "sender_email_ids": [1],
-                "sender_emails": {"search": "x", "limit": 1},
-            }
-        )
+def test_schedule_accepts_full_24h_range() -> None:
+    CampaignSchedule.model_validate(_SCHEDULE)
 
 
-def test_sender_email_selector_limit_ge_1() -> None:
+def test_specs_are_immutable() -> None:
+    spec = SequenceSpec.model_validate(
+        {
+            "title": "x",
+            "sequence_steps": [{"email_subject": "s", "email_body": "b", "wait_in_days": 1}],
+        }
+    )
     with pytest.raises(ValidationError):
-        CampaignCreateSpec.model_validate(
-            {"name": "x", "sender_emails": {"search": "x", "limit": 0}}
-        )
+        spec.title = "y"
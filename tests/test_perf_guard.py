@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+# Per-phase timings as printed by `--durations`, e.g. "0.01s call     tests/test_x.py::test_y".
+_DURATION_LINE = re.compile(r"^(\d+\.\d+)s (setup|call|teardown)\s+(\S+)$", re.MULTILINE)
+
+
+@pytest.mark.perf
+@pytest.mark.skipif(
+    os.environ.get("EMAILBISON_PERF") != "1", reason="set EMAILBISON_PERF=1 to run the perf guard"
+)
+def test_client_tests_stay_fast() -> None:
+    max_ms = float(os.environ.get("EMAILBISON_PERF_MAX_MS", "200"))
+    target = Path(__file__).with_name("test_client.py")
+
+    proc = subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "pytest",
+            "-q",
+            "-p",
+            "no:cacheprovider",
+            "--durations=0",
+            "--durations-min=0",
+            str(target),
+        ],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    assert proc.returncode == 0, proc.stdout + proc.stderr
+
+    timings = [
+        (float(s) * 1000, phase, nodeid) for s, phase, nodeid in _DURATION_LINE.findall(proc.stdout)
+    ]
+    assert timings, proc.stdout
+    slow = [f"{ms:.0f}ms {phase} {nodeid}" for ms, phase, nodeid in timings if ms > max_ms]
+    assert not slow, f"tests over {max_ms:.0f}ms:\n" + "\n".join(slow)
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+import respx
+from httpx import Response
+from typer.testing import CliRunner
+
+from emailbison.cli import app
+
+
+def test_list_renders_rows_and_falls_back_to_payload(
+    respx_mock: respx.MockRouter, cli_env: None
+) -> None:
+    route = respx_mock.get("https://api.example.com/api/sender-emails").mock(
+        side_effect=[
+            Response(
+                200,
+                json={
+                    "data": [
+                        {"id": 1, "status": "Connected", "daily_limit": 30, "email": "a@x.io"},
+                        {"id": 2, "email": "b@x.io"},
+                    ]
+                },
+            ),
+            Response(200, json={"data": []}),
+        ]
+    )
+
+    runner = CliRunner()
+    result = runner.invoke(app, ["sender-emails", "list"])
+
+    assert result.exit_code == 0, result.output
+    assert result.stdout.splitlines() == [
+        "id=1 status=Connected daily_limit=30 email=a@x.io",
+        "id=2 status=None daily_limit=None email=b@x.io",
+    ]
+
+    result = runner.invoke(app, ["sender-emails", "list"])
+
+    assert result.exit_code == 0, result.output
+    assert result.stdout.strip() == "{'data': []}"
+    assert route.call_count == 2
@@ -1,8 +1,27 @@
 from __future__ import annotations
 
-# Time parsing not currently used in v1 (EmailBison schedule uses HH:MM strings).
-# Keeping this file as a placeholder for future datetime-related helpers.
+from datetime import UTC, datetime, timedelta
 
+import pytest
 
-def test_placeholder() -> None:
-    assert True
+from emailbison.utils.time import TimeParseError, parse_datetime
+
+
+@pytest.mark.parametrize(
+    "value",
+    ["2024-07-01T09:30:00Z", "2024-07-01T09:30:00+00:00", "2024-07-01T09:30:00.000Z"],
+)
+def test_parse_datetime_utc_variants(value: str) -> None:
+    assert parse_datetime(value) == datetime(2024, 7, 1, 9, 30, tzinfo=UTC)
+
+
+def test_parse_datetime_applies_default_tz_to_naive_values() -> None:
+    dt = parse_datetime("2024-01-15 08:00", default_tz="America/New_York")
+    assert dt.utcoffset() == timedelta(hours=-5)
+
+
+def test_parse_datetime_rejects_garbage_and_unknown_zones() -> None:
+    with pytest.raises(TimeParseError, match="Invalid datetime"):
+        parse_datetime("not a date")
+    with pytest.raises(TimeParseError, match="Unknown timezone"):
+        parse_datetime("2024-01-15T08:00", default_tz="Nowhere/Special")